@@ -1,10 +1,29 @@
+import bisect
+import copy
+import datetime
+import hashlib
+import heapq
+import marshal
 import os
 import re
 import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
 import tkinter as tk
-from tkinter import ttk, filedialog
+from tkinter import ttk, filedialog, messagebox
+from collections import OrderedDict, deque
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 import yaml
 
+try:
+    from PIL import Image, ImageDraw, ImageFont, ImageTk
+except ImportError:  # optional: without Pillow preview tiles are drawn as text
+    Image = None
+
 # =========================
 # THEME
 # =========================
@@ -28,6 +47,10 @@ MAX_WEEKS = 4
 MAX_REWARDS = 50
 MAX_TIERS = 50
 MAX_WINDOW_WIDTH = 1920
+DOC_KEYS = ("free", "premium", "rewards", "quests", "week_pool")
+IO_WORKERS = 5
+IO_POLL_MS = 30
+PRESERIALIZE_DELAY_MS = 800
 FREE_TIER_REWARD_LIMIT = 1
 PREMIUM_TIER_REWARD_LIMIT = 2
 
@@ -35,29 +58,80 @@ PREMIUM_TIER_REWARD_LIMIT = 2
 # =========================
 # YAML HELPERS
 # =========================
-def safe_load_yaml(path: str) -> dict:
-    if not path or not os.path.exists(path):
-        return {}
-    with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-    return data if isinstance(data, dict) else {}
-
-
-def safe_dump_yaml(path: str, data: dict):
-    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        yaml.safe_dump(
-            data,
-            f,
-            sort_keys=False,
-            allow_unicode=True,
-            width=120,
-            default_flow_style=False,
-        )
-
-
+YAML_DUMP_OPTIONS = {
+    "sort_keys": False,
+    "allow_unicode": True,
+    "width": 120,
+    "default_flow_style": False,
+}
+
+
+# Shared sub-trees are written out in full instead of as &id anchors, so every entity serializes on its own.
+class PlainSafeDumper(yaml.SafeDumper):
+    def ignore_aliases(self, data):
+        return True
+
+
+# name -> (Loader, Dumper). "libyaml" is only available when PyYAML was built against it.
+YAML_BACKENDS = {"python": (yaml.SafeLoader, PlainSafeDumper)}
+if getattr(yaml, "__with_libyaml__", False):
+
+    class PlainCSafeDumper(yaml.CSafeDumper):
+        def ignore_aliases(self, data):
+            return True
+
+    YAML_BACKENDS["libyaml"] = (yaml.CSafeLoader, PlainCSafeDumper)
+
+YAML_BACKEND = "libyaml" if "libyaml" in YAML_BACKENDS else "python"
+
+# libyaml's emitter disagrees with PyYAML's on escaped / non-BMP characters and on empty or long keys.
+# Documents containing any of those are emitted by the pure-Python dumper so saved files stay identical.
+_LIBYAML_UNSAFE_CHARS = re.compile("[^\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufefe\uff00-\ufffd]")
+_LIBYAML_MAX_KEY_BYTES = 100
+_LIBYAML_SAFE_SCALARS = (bool, int, float, datetime.date, type(None))
+
+
+def _yaml_backend(name=None):
+    return YAML_BACKENDS.get(name or YAML_BACKEND, YAML_BACKENDS["python"])
+
+
+def libyaml_can_emit(data) -> bool:
+    stack = [data]
+    while stack:
+        v = stack.pop()
+        if isinstance(v, str):
+            if _LIBYAML_UNSAFE_CHARS.search(v):
+                return False
+        elif isinstance(v, (dict, Entity)):
+            for k, item in v.items():
+                if isinstance(k, str):
+                    if not k or len(k.encode("utf-8")) >= _LIBYAML_MAX_KEY_BYTES or _LIBYAML_UNSAFE_CHARS.search(k):
+                        return False
+                elif not isinstance(k, _LIBYAML_SAFE_SCALARS):
+                    return False
+                stack.append(item)
+        elif isinstance(v, list):
+            stack.extend(v)
+        elif not isinstance(v, _LIBYAML_SAFE_SCALARS):
+            return False
+    return True
+
+
+def load_yaml_text(text: str, backend=None):
+    loader, _dumper = _yaml_backend(backend)
+    return yaml.load(text, Loader=loader)
+
+
+def dump_yaml_text(data, backend=None) -> str:
+    name = backend or YAML_BACKEND
+    if name == "libyaml" and not libyaml_can_emit(data):
+        name = "python"
+    _loader, dumper = _yaml_backend(name)
+    return yaml.dump(data, Dumper=dumper, **YAML_DUMP_OPTIONS)
+
+
 def ensure_dict(v):
-    return v if isinstance(v, dict) else {}
+    return v if isinstance(v, (dict, Entity)) else {}
 
 
 def ensure_list(v):
@@ -81,10 +155,52 @@ def next_numeric_string_id(existing_keys):
     return str(max(nums) + 1 if nums else 1)
 
 
+_ATOMIC_TYPES = frozenset({str, int, float, bool, type(None), bytes, datetime.date, datetime.datetime})
+
+
+def structural_copy(obj):
+    # Independent copy of a plain YAML tree (dicts, lists, scalars) without copy.deepcopy's memo bookkeeping.
+    # Shared sub-trees come out as separate copies, which is what the dumpers write anyway.
+    cls = type(obj)
+    if cls is dict:
+        return {k: v if type(v) in _ATOMIC_TYPES else structural_copy(v) for k, v in obj.items()}
+    if cls is list:
+        return [v if type(v) in _ATOMIC_TYPES else structural_copy(v) for v in obj]
+    if cls in _ATOMIC_TYPES:
+        return obj
+    if isinstance(obj, Entity):
+        return obj._new(obj._keys, tuple(v if type(v) in _ATOMIC_TYPES else structural_copy(v) for v in obj._values))
+    return copy.deepcopy(obj)
+
+
+def cow_copy(obj):
+    # Copy-on-write duplicate: a new top-level container whose nested lists/dicts are shared with obj.
+    # Editors never mutate nested containers in place; they build a replacement and assign it to the entity.
+    cls = type(obj)
+    if cls is dict or cls is list:
+        return cls(obj)
+    if isinstance(obj, Entity):
+        return obj.copy()
+    return structural_copy(obj)
+
+
 def deep_copy(obj):
-    return yaml.safe_load(yaml.safe_dump(obj))
-
-
+    return structural_copy(obj)
+
+
+def detached_copy(obj):
+    # structural_copy that also walks LazyEntities: pending entities are immutable byte spans, so they are
+    # shared as they are instead of being parsed
+    cls = type(obj)
+    if cls is LazyEntities:
+        return LazyEntities((k, v if type(v) is PendingEntity else detached_copy(v)) for k, v in dict.items(obj))
+    if cls is dict:
+        return {k: v if type(v) in _ATOMIC_TYPES else detached_copy(v) for k, v in obj.items()}
+    if cls is list:
+        return [v if type(v) in _ATOMIC_TYPES else detached_copy(v) for v in obj]
+    return structural_copy(obj)
+
+
 def split_lines(text: str):
     out = []
     for ln in (text or "").splitlines():
@@ -126,6 +242,1242 @@ def clamp_int(raw: str, minimum: int, maximum: int, fallback: int) -> int:
     return max(minimum, min(maximum, value))
 
 
+# =========================
+# DOCUMENT CACHE
+# =========================
+DOC_CACHE_SIZE = 16
+
+
+def file_fingerprint(path: str):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def content_digest(raw: bytes) -> str:
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+class DocumentCache:
+    # Parsed documents keyed by absolute path. An entry is reused while the file's (mtime, size) is unchanged;
+    # when those differ and hashing is on, an identical content digest still counts as a hit.
+    # Entries keep their own copy: load() hands out a detached copy, so edits never reach the cache.
+    def __init__(self, max_entries: int = DOC_CACHE_SIZE, hash_contents: bool = True, snapshots: bool = False):
+        self.max_entries = max_entries
+        self.hash_contents = hash_contents
+        # read/write binary sidecars (see SNAPSHOTS) so a fresh process can skip YAML parsing
+        self.snapshots = snapshots
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.snapshot_hits = 0
+        # path -> InternStats of its last parse
+        self.intern_stats = {}
+
+    def load(self, path: str, collection: str | None = None):
+        # Returns (data, parsed, layout). Safe to call from worker threads; only the bookkeeping is serialized.
+        # With a collection key the entity byte spans are recorded too (see DocumentLayout).
+        if not path or not os.path.exists(path):
+            return {}, False, None
+        key = os.path.abspath(path)
+        stat_fp = file_fingerprint(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stat_fp:
+                data = self._hit(key)
+        if entry is not None and entry[0] == stat_fp:
+            return detached_copy(data), False, entry[3]
+
+        with open(key, "rb") as f:
+            raw = f.read()
+        digest = content_digest(raw) if self.hash_contents else None
+        with self._lock:
+            if entry is not None and digest is not None and entry[1] == digest and self._entries.get(key) is entry:
+                entry[0] = stat_fp
+                if entry[3] is not None:
+                    entry[3].stat = stat_fp
+                data = self._hit(key)
+            else:
+                entry = None
+        if entry is not None:
+            return detached_copy(data), False, entry[3]
+
+        snapshot = read_snapshot(key, raw, collection, digest) if self.snapshots else None
+        if snapshot is not None:
+            data, layout = snapshot
+        else:
+            data, layout = parse_document(raw, collection)
+            stats = InternStats()
+            data = intern_tree(data, stats)
+            with self._lock:
+                self.intern_stats[key] = stats
+            if self.snapshots:
+                write_snapshot(key, raw, data, layout, collection, digest)
+        adopt_entities(data, collection)
+        if layout is not None:
+            layout.stat = stat_fp
+        with self._lock:
+            if snapshot is not None:
+                self.snapshot_hits += 1
+            else:
+                self.misses += 1
+            self._put(key, [stat_fp, digest, data, layout])
+        return detached_copy(data), snapshot is None, layout
+
+    def store(self, path: str, data: dict, raw: bytes | None = None, layout=None):
+        # data becomes the entry's own copy: pass one nothing else will change (like the save snapshot)
+        if not path or not os.path.exists(path):
+            return
+        key = os.path.abspath(path)
+        digest = None
+        if self.hash_contents:
+            if raw is None:
+                with open(key, "rb") as f:
+                    raw = f.read()
+            digest = content_digest(raw)
+        with self._lock:
+            self._put(key, [file_fingerprint(key), digest, data, layout])
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _hit(self, key):
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return self._entries[key][2]
+
+    def _put(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+# =========================
+# FRAGMENT CACHE
+# =========================
+# document key -> top-level key holding its entities ("" means the document root is the collection)
+ENTITY_COLLECTIONS = {"rewards": "", "free": "tiers", "premium": "tiers", "quests": "quests", "week_pool": "weeks"}
+_NOT_ENTITY = object()
+
+
+def entity_signature(value) -> bytes:
+    return hashlib.blake2b(repr(value).encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def split_entity_blocks(text: str, indent: str):
+    # Entity keys are the only lines starting exactly at `indent`; indentless "- " items and blank lines
+    # inside quoted scalars are the two things that can also sit there.
+    n = len(indent)
+    blocks = []
+    for line in text.splitlines(keepends=True):
+        starts = line.startswith(indent) and len(line) > n and line[n] not in " \r\n"
+        if starts and line[n] == "-" and line[n + 1 : n + 2] in ("", " ", "\r", "\n"):
+            starts = False
+        if starts or not blocks:
+            blocks.append([line])
+        else:
+            blocks[-1].append(line)
+    return ["".join(b) for b in blocks]
+
+
+class FragmentCache:
+    # One serialized YAML block per entity (reward id, tier id, quest id, week), keyed by a content signature.
+    # render() re-emits only entities whose signature changed and stitches the file together from the rest.
+    # Fragments are emitted inside their real parent so indentation and line folding match a full dump.
+    def __init__(self):
+        self._docs = {}
+        self._headers = {}
+        self._lock = threading.Lock()
+        self.rendered = 0
+        self.reused = 0
+
+    def render(self, doc_key: str, data, with_layout: bool = False):
+        # -> text, or (encoded bytes, DocumentLayout | None) with_layout
+        ckey = ENTITY_COLLECTIONS.get(doc_key)
+        coll = None
+        if ckey is not None and isinstance(data, dict):
+            coll = data if ckey == "" else data.get(ckey)
+        if not isinstance(coll, dict) or not coll:
+            text = dump_yaml_text(data)
+            return (encode_document(text), None) if with_layout else text
+
+        with self._lock:
+            previous = self._docs.get(doc_key, {})
+        fresh = {}
+        missing = []
+        for eid, entity in coll.items():
+            sig = entity_signature(entity)
+            hit = previous.get(eid)
+            if hit is not None and hit[0] == sig:
+                fresh[eid] = hit
+            else:
+                fresh[eid] = (sig, None)
+                missing.append(eid)
+        if missing:
+            self._render_missing(ckey, coll, missing, fresh)
+        with self._lock:
+            self._docs[doc_key] = fresh
+            self.rendered += len(missing)
+            self.reused += len(coll) - len(missing)
+
+        if not with_layout:
+            body = "".join(text for _sig, text in fresh.values())
+            if ckey == "":
+                return body
+            parts = []
+            for key, value in data.items():
+                parts.append(self._header(ckey) + body if key == ckey else dump_yaml_text({key: value}))
+            return "".join(parts)
+
+        # same text, emitted piece by piece so each entity's byte span is known
+        pieces = []
+        for key, value in (data.items() if ckey else [(ckey, coll)]):
+            if key != ckey:
+                pieces.append((_NOT_ENTITY, dump_yaml_text({key: value})))
+                continue
+            if ckey:
+                pieces.append((_NOT_ENTITY, self._header(ckey)))
+            pieces.extend((eid, text) for eid, (_sig, text) in fresh.items())
+        chunks = []
+        entries = []
+        offset = 0
+        for eid, text in pieces:
+            chunk = encode_document(text)
+            if eid is not _NOT_ENTITY:
+                entries.append((eid, offset, offset + len(chunk), fresh[eid][0]))
+            chunks.append(chunk)
+            offset += len(chunk)
+        raw = b"".join(chunks)
+        others = {k: entity_signature(v) for k, v in data.items() if k != ckey} if ckey else {}
+        root_keys = list(data.keys()) if ckey else []
+        return raw, DocumentLayout(raw, os.linesep, ckey, root_keys, others, entries)
+
+    def fragment(self, doc_key: str, eid, entity, sig: bytes | None = None) -> str:
+        sig = sig or entity_signature(entity)
+        with self._lock:
+            hit = self._docs.get(doc_key, {}).get(eid)
+        if hit is not None and hit[0] == sig:
+            return hit[1]
+        return self._emit(ENTITY_COLLECTIONS.get(doc_key, ""), {eid: entity})
+
+    def clear(self, doc_key: str | None = None):
+        with self._lock:
+            if doc_key is None:
+                self._docs.clear()
+            else:
+                self._docs.pop(doc_key, None)
+
+    def _emit(self, ckey, entities: dict) -> str:
+        if ckey == "":
+            return dump_yaml_text(entities)
+        return dump_yaml_text({ckey: entities}).split("\n", 1)[1]
+
+    def _header(self, ckey) -> str:
+        header = self._headers.get(ckey)
+        if header is None:
+            header = dump_yaml_text({ckey: {"x": None}}).split("\n", 1)[0] + "\n"
+            self._headers[ckey] = header
+        return header
+
+    def _render_missing(self, ckey, coll, missing, fresh):
+        # one dump for the whole batch, split back into entities; fall back to per-entity dumps if the split
+        # does not line up (e.g. complex "? " keys)
+        text = self._emit(ckey, {eid: coll[eid] for eid in missing})
+        blocks = split_entity_blocks(text, "" if ckey == "" else "  ")
+        if len(blocks) != len(missing):
+            blocks = [self._emit(ckey, {eid: coll[eid]}) for eid in missing]
+        for eid, block in zip(missing, blocks):
+            fresh[eid] = (fresh[eid][0], block)
+
+
+# =========================
+# PATCH SAVE
+# =========================
+class DocumentLayout:
+    # Byte spans of the entities in a document's bytes as read from (or written to) disk.
+    # entries: (entity id, start, end, signature) in file order; others: signatures of the root keys that are
+    # not the entity collection. Gaps between spans (comments, blank lines) are kept verbatim by patches.
+    __slots__ = ("raw", "newline", "ckey", "root_keys", "others", "entries", "stat")
+
+    def __init__(self, raw, newline, ckey, root_keys, others, entries, stat=None):
+        self.raw = raw
+        self.newline = newline
+        self.ckey = ckey
+        self.root_keys = root_keys
+        self.others = others
+        self.entries = entries
+        self.stat = stat
+
+
+def _newline_style(raw: bytes):
+    crlf = raw.count(b"\r\n")
+    if crlf == 0 and b"\r" not in raw:
+        return "\n"
+    if crlf == raw.count(b"\n") == raw.count(b"\r"):
+        return "\r\n"
+    return None
+
+
+def _last_content_line(node, seen):
+    # last line holding content of node, or None when spans cannot be trusted (aliases, block scalars)
+    if id(node) in seen:
+        return None
+    seen.add(id(node))
+    if isinstance(node, yaml.ScalarNode):
+        if node.style is None and node.value == "":
+            return -1  # an empty value is marked at the next token, which may belong to another entity
+        return None if node.style in ("|", ">") else node.end_mark.line
+    last = node.end_mark.line if node.flow_style else node.start_mark.line
+    children = node.value if isinstance(node, yaml.SequenceNode) else [n for pair in node.value for n in pair]
+    for child in children:
+        line = _last_content_line(child, seen)
+        if line is None:
+            return None
+        last = max(last, line)
+    return last
+
+
+def build_layout(raw: bytes, text: str, root, data: dict, ckey: str):
+    newline = _newline_style(raw)
+    if newline is None or any(ch in text for ch in ("\x85", "\u2028", "\u2029")):
+        return None
+    if not isinstance(root, yaml.MappingNode) or root.flow_style or len(root.value) != len(data):
+        return None
+    root_keys = list(data.keys()) if ckey else []
+    if ckey == "":
+        coll_node, coll, column, others = root, data, 0, {}
+        lower, upper = 0, len(raw)
+    else:
+        if ckey not in data:
+            return None
+        idx = root_keys.index(ckey)
+        coll_node, coll, column = root.value[idx][1], data[ckey], 2
+        others = {k: entity_signature(v) for k, v in data.items() if k != ckey}
+    if not isinstance(coll_node, yaml.MappingNode) or coll_node.flow_style or not isinstance(coll, dict):
+        return None
+    if not coll or len(coll) != len(coll_node.value):
+        return None
+
+    line_starts = [0]
+    line_starts.extend(m.end() for m in re.finditer(b"\n", raw))
+    if ckey != "":
+        lower = line_starts[root.value[idx][0].end_mark.line + 1]
+        upper = line_starts[root.value[idx + 1][0].start_mark.line] if idx + 1 < len(root.value) else len(raw)
+
+    seen = set()
+    entries = []
+    prev_end = lower
+    for eid, (knode, vnode) in zip(coll.keys(), coll_node.value):
+        mark = knode.start_mark
+        # patched fragments are emitted at our own indentation, so only files that use it can be patched
+        if not isinstance(knode, yaml.ScalarNode) or mark.column != column or knode.end_mark.line != mark.line:
+            return None
+        last = _last_content_line(vnode, seen)
+        if last is None:
+            return None
+        start = line_starts[mark.line]
+        end = line_starts[last + 1] if last + 1 < len(line_starts) else len(raw)
+        if start < prev_end or end > upper:
+            return None
+        entries.append((eid, start, end, entity_signature(coll[eid])))
+        prev_end = end
+    return DocumentLayout(raw, newline, ckey, root_keys, others, entries)
+
+
+def parse_document(raw: bytes, collection: str | None = None):
+    # -> (data, DocumentLayout | None); the layout comes from the same parse, the file is not read twice
+    text = raw.decode("utf-8")
+    if collection is None:
+        data = load_yaml_text(text)
+        return (data if isinstance(data, dict) else {}), None
+    if collection == "" and len(raw) >= LAZY_ENTITY_MIN_BYTES:
+        scanned = scan_entities(raw, text)
+        if scanned is not None:
+            return scanned
+    loader_cls, _dumper = _yaml_backend()
+    loader = loader_cls(text)
+    try:
+        node = loader.get_single_node()
+        data = loader.construct_document(node) if node is not None else None
+    finally:
+        loader.dispose()
+    if not isinstance(data, dict):
+        return {}, None
+    return data, build_layout(raw, text, node, data, collection)
+
+
+def patch_document(layout: DocumentLayout, data, emit):
+    # -> (bytes, new layout, (first, last)) or None when a full dump is needed.
+    # Unchanged entities keep their original bytes (and comments); changed ones are re-emitted via emit(eid, entity);
+    # removed ones drop out; new ones go after the last existing entity. (first, last) bound the bytes that differ.
+    ckey = layout.ckey
+    if not isinstance(data, dict) or (ckey != "" and list(data.keys()) != layout.root_keys):
+        return None
+    for key, sig in layout.others.items():
+        if entity_signature(data[key]) != sig:
+            return None
+    coll = data if ckey == "" else data[ckey]
+    if not isinstance(coll, dict) or not coll:
+        return None
+    position = {entry[0]: i for i, entry in enumerate(layout.entries)}
+    last_index = -1
+    added = []
+    for eid in coll:
+        i = position.get(eid)
+        if i is None:
+            added.append(eid)
+        elif added or i < last_index:
+            return None  # reordered; the spans no longer say where things go
+        else:
+            last_index = i
+
+    raw = layout.raw
+    newline = layout.newline
+    out = []
+    entries = []
+    size = 0
+    first = None
+    last = None
+    pos = 0
+
+    def encode(eid, entity):
+        text = emit(eid, entity)
+        if newline != "\n":
+            text = text.replace("\n", newline)
+        return text.encode("utf-8")
+
+    for eid, start, end, sig in layout.entries:
+        gap = raw[pos:start]
+        out.append(gap)
+        size += len(gap)
+        pos = end
+        if eid not in coll:
+            if first is None:
+                first = size
+            last = size
+            continue
+        value = dict.get(coll, eid)
+        if type(value) is PendingEntity and (
+            (value.raw is raw and value.start == start) or value.raw[value.start:value.end] == raw[start:end]
+        ):
+            # never opened since it was scanned, so it still is exactly these bytes (a reorder can move a
+            # pending span under another id, hence the check that it is this one)
+            new_sig = sig
+            chunk = raw[start:end]
+        else:
+            entity = coll[eid]
+            new_sig = entity_signature(entity)
+            if sig is None:
+                sig = entity_signature(parse_entity_block(raw[start:end]))
+            chunk = raw[start:end] if new_sig == sig else None
+        if chunk is None:
+            chunk = encode(eid, entity)
+            if first is None:
+                first = size
+            last = size + len(chunk)
+        entries.append((eid, size, size + len(chunk), new_sig))
+        out.append(chunk)
+        size += len(chunk)
+
+    if added and not raw[:pos].endswith(b"\n"):
+        out.append(newline.encode("utf-8"))
+        size += len(newline)
+    for eid in added:
+        chunk = encode(eid, coll[eid])
+        if first is None:
+            first = size
+        entries.append((eid, size, size + len(chunk), entity_signature(coll[eid])))
+        out.append(chunk)
+        size += len(chunk)
+        last = size
+    tail = raw[pos:]
+    out.append(tail)
+    size += len(tail)
+
+    new_raw = b"".join(out)
+    if first is None:
+        first = last = size
+    elif size != len(raw):
+        last = size
+    new_layout = DocumentLayout(new_raw, newline, ckey, layout.root_keys, layout.others, entries)
+    return new_raw, new_layout, (first, last)
+
+
+def render_document(doc_key: str, data, layout, fragments):
+    # -> (bytes, layout of those bytes, (first, last) changed range or None for a full rewrite)
+    if layout is not None:
+        patched = patch_document(layout, data, lambda eid, entity: fragments.fragment(doc_key, eid, entity))
+        if patched is not None:
+            return patched
+    raw, new_layout = fragments.render(doc_key, data, with_layout=True)
+    return raw, new_layout, None
+
+
+# =========================
+# LAZY ENTITIES
+# =========================
+# Big root-level collections (rewards.yml) are scanned from the YAML event stream instead of being constructed:
+# each entity keeps its byte span plus the few scalar columns the list views show, and is only parsed when
+# something actually reads it.
+LAZY_ENTITY_MIN_BYTES = 512 * 1024
+LAZY_COLUMNS = ("name", "type", "group")
+_STR_TAG = "tag:yaml.org,2002:str"
+_NOT_SCANNED = object()  # column holding a collection; reading it parses the entity
+
+
+class PendingEntity:
+    __slots__ = ("raw", "start", "end", "columns")
+
+    def __init__(self, raw, start, end, columns):
+        self.raw = raw
+        self.start = start
+        self.end = end
+        self.columns = columns
+
+    def parse(self):
+        return parse_entity_block(self.raw[self.start:self.end])
+
+
+def parse_entity_block(block: bytes):
+    # a span starts at its key's line, so it parses on its own as a one-entry mapping
+    data = load_yaml_text(block.decode("utf-8"))
+    return intern_tree(next(iter(data.values()))) if isinstance(data, dict) and data else None
+
+
+class LazyEntities(dict):
+    # A dict whose values may still be PendingEntity; every read path parses them on the way out.
+    # column() answers list-view lookups without parsing.
+    def column(self, key, name, default=""):
+        value = dict.get(self, key)
+        if type(value) is PendingEntity:
+            found = value.columns.get(name, default)
+            if found is not _NOT_SCANNED:
+                return found
+            value = self[key]
+        return ensure_dict(value).get(name, default)
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        if type(value) is PendingEntity:
+            # only root-level rewards are scanned lazily
+            value = Reward.adopt(value.parse())
+            dict.__setitem__(self, key, value)
+        return value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def pop(self, key, *default):
+        if key in self:
+            value = self[key]
+            dict.__delitem__(self, key)
+            return value
+        return dict.pop(self, key, *default)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            dict.__setitem__(self, key, default)
+        return self[key]
+
+    def values(self):
+        return [self[k] for k in self]
+
+    def items(self):
+        return [(k, self[k]) for k in self]
+
+    def __eq__(self, other):
+        return dict(self.items()) == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def copy(self):
+        return LazyEntities(dict.items(self))
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo):
+        # pending spans are immutable, only parsed entities need copying
+        out = LazyEntities()
+        for key, value in dict.items(self):
+            dict.__setitem__(out, key, value if type(value) is PendingEntity else structural_copy(value))
+        return out
+
+
+for _dumper in {yaml.SafeDumper, *(dumper for _loader, dumper in YAML_BACKENDS.values())}:
+    _dumper.add_representer(LazyEntities, lambda dumper, data: dumper.represent_dict(data))
+
+
+def entity_column(coll: dict, key, name, default=""):
+    if isinstance(coll, LazyEntities):
+        return coll.column(key, name, default)
+    return ensure_dict(coll.get(key, {})).get(name, default)
+
+
+def _scalar_value(loader, event):
+    tag = event.tag if event.tag not in (None, "!") else loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+    return event.value if tag == _STR_TAG else load_yaml_text(event.value)
+
+
+def scan_entities(raw: bytes, text: str):
+    # -> (LazyEntities, DocumentLayout) or None when the document needs a real parse
+    if _newline_style(raw) is None or any(ch in text for ch in ("\x85", "\u2028", "\u2029")):
+        return None
+    loader_cls, _dumper = _yaml_backend()
+    loader = loader_cls(text)
+    line_starts = [0]
+    line_starts.extend(m.end() for m in re.finditer(b"\n", raw))
+    entities = LazyEntities()
+    entries = []
+    flow = []  # flow_style of each open collection
+    eid = None
+    columns = sub_key = None
+    entity_is_map = False
+    first_line = last_line = 0
+
+    def close_entity():
+        start = line_starts[first_line]
+        end = line_starts[last_line + 1] if last_line + 1 < len(line_starts) else len(raw)
+        if entries and start < entries[-1][2]:
+            return False
+        entries.append((eid, start, end, None))
+        dict.__setitem__(entities, eid, PendingEntity(raw, start, end, columns))
+        return True
+
+    try:
+        for event in yaml.parse(text, Loader=loader_cls):
+            kind = type(event)
+            if kind is yaml.AliasEvent or getattr(event, "anchor", None):
+                return None
+            depth = len(flow)
+            if kind is yaml.ScalarEvent:
+                if event.style in ("|", ">"):
+                    return None
+                if depth == 1 and eid is None:
+                    mark = event.start_mark
+                    if mark.column != 0 or event.end_mark.line != mark.line:
+                        return None
+                    key = _scalar_value(loader, event)
+                    if not isinstance(key, str) or key in entities:
+                        return None
+                    eid, columns, sub_key = key, {}, None
+                    first_line = last_line = mark.line
+                    continue
+                if not (event.style is None and event.value == ""):
+                    last_line = max(last_line, event.end_mark.line)
+                if depth == 1:
+                    if not close_entity():
+                        return None
+                    eid = None
+                elif depth == 2 and entity_is_map:
+                    if sub_key is None:
+                        sub_key = _scalar_value(loader, event)
+                    else:
+                        if sub_key in LAZY_COLUMNS:
+                            columns[sub_key] = _scalar_value(loader, event)
+                        sub_key = None
+            elif kind is yaml.MappingStartEvent or kind is yaml.SequenceStartEvent:
+                if depth == 0 and (kind is not yaml.MappingStartEvent or event.flow_style):
+                    return None
+                if depth == 1:
+                    entity_is_map = kind is yaml.MappingStartEvent
+                elif depth == 2 and entity_is_map:
+                    if sub_key is None:
+                        return None  # complex key
+                    if sub_key in LAZY_COLUMNS:
+                        columns[sub_key] = _NOT_SCANNED
+                    sub_key = None
+                flow.append(bool(event.flow_style))
+            elif kind is yaml.MappingEndEvent or kind is yaml.SequenceEndEvent:
+                if flow.pop():
+                    last_line = max(last_line, event.end_mark.line)
+                if len(flow) == 1:
+                    if not close_entity():
+                        return None
+                    eid = None
+    except yaml.YAMLError:
+        return None
+    finally:
+        loader.dispose()
+    if not entries:
+        return None
+    return entities, DocumentLayout(raw, _newline_style(raw), "", [], {}, entries)
+
+
+# =========================
+# SNAPSHOTS
+# =========================
+# A snapshot is a marshal dump of a parsed document (and its layout) kept in the user's own cache directory,
+# never next to the YAML (plugin config folders are often shared, and marshal data must not come from others).
+# It is only trusted while the source bytes hash to the digest it was written for, and only by the same
+# Python version, since marshal's format is not stable across versions.
+SNAPSHOT_MAGIC = b"BPSNAP1 %d.%d\n" % sys.version_info[:2]
+
+
+def snapshot_dir() -> str:
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser(os.path.join("~", "AppData", "Local"))
+    elif sys.platform == "darwin":
+        base = os.path.expanduser(os.path.join("~", "Library", "Caches"))
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser(os.path.join("~", ".cache"))
+    return os.path.join(base, "BattlePassStudio", "snapshots")
+
+
+SNAPSHOT_DIR = snapshot_dir()
+
+
+def snapshot_path(path: str) -> str:
+    full = os.path.abspath(path)
+    digest = hashlib.sha1(full.encode("utf-8", "surrogateescape")).hexdigest()[:16]
+    return os.path.join(SNAPSHOT_DIR, f"{os.path.basename(full)}.{digest}.bpsnap")
+
+
+def write_snapshot(path: str, raw: bytes, data, layout=None, collection=None, digest=None) -> bool:
+    if isinstance(data, LazyEntities):
+        return False  # scanning is already cheap, and snapshotting would mean parsing everything
+    lay = None
+    if layout is not None:
+        lay = (layout.newline, layout.ckey, layout.root_keys, layout.others, layout.entries)
+    try:
+        plain = plain_entities(data, collection)
+        payload = marshal.dumps((digest or content_digest(raw), len(raw), collection, plain, lay))
+    except (ValueError, RuntimeError):
+        # timestamps and other non-plain values can't be marshalled; those documents are just parsed each time
+        return False
+    target = snapshot_path(path)
+    try:
+        os.makedirs(SNAPSHOT_DIR, mode=0o700, exist_ok=True)
+        os.replace(stage_file(target, SNAPSHOT_MAGIC + payload), target)
+    except OSError:
+        return False
+    return True
+
+
+def read_snapshot(path: str, raw: bytes, collection=None, digest=None):
+    # -> (data, layout) or None when missing, stale or unreadable
+    try:
+        with open(snapshot_path(path), "rb") as f:
+            blob = f.read()
+    except OSError:
+        return None
+    if not blob.startswith(SNAPSHOT_MAGIC):
+        return None
+    try:
+        src_digest, size, coll, data, lay = marshal.loads(blob[len(SNAPSHOT_MAGIC):])
+    except (EOFError, ValueError, TypeError):
+        return None
+    if size != len(raw) or coll != collection or not isinstance(data, dict):
+        return None
+    if src_digest != (digest or content_digest(raw)):
+        return None
+    return data, (DocumentLayout(raw, *lay) if lay is not None else None)
+
+
+# =========================
+# ATOMIC SAVE
+# =========================
+def encode_document(text: str) -> bytes:
+    # same bytes the old text-mode open(path, "w") produced, including platform newlines
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    return text.encode("utf-8")
+
+
+def _remove_quietly(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _fsync_dir(directory: str):
+    if os.name == "nt":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def stage_file(path: str, raw: bytes) -> str:
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix="." + os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            shutil.copymode(path, tmp)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp, 0o666 & ~umask)
+    except BaseException:
+        _remove_quietly(tmp)
+        raise
+    return tmp
+
+
+def file_holds(path: str, raw: bytes, layout=None) -> bool:
+    # True when path already contains exactly raw, so writing it would change nothing
+    stat = file_fingerprint(path)
+    if stat is None or stat[1] != len(raw):
+        return False
+    if layout is not None and layout.stat == stat:
+        return layout.raw == raw
+    with open(path, "rb") as f:
+        return content_digest(f.read()) == content_digest(raw)
+
+
+def write_in_place(path: str, expected_stat, raw: bytes, first: int, last: int):
+    # rewrites only raw[first:last] of a file known to hold the layout's bytes; anything else gets a full write
+    if file_fingerprint(path) != expected_stat:
+        os.replace(stage_file(path, raw), path)
+        return
+    with open(path, "r+b") as f:
+        f.seek(first)
+        f.write(raw[first:last])
+        f.truncate(len(raw))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def commit_staged(staged, patches=()):
+    # every temp file is fully written and fsynced before the first rename, so the batch swaps in back to back
+    directories = set()
+    for tmp, path in staged:
+        os.replace(tmp, path)
+        directories.add(os.path.dirname(os.path.abspath(path)))
+    for directory in directories:
+        _fsync_dir(directory)
+    for patch in patches:
+        write_in_place(*patch)
+
+
+def discard_staged(staged):
+    for tmp, _path in staged:
+        _remove_quietly(tmp)
+
+
+# =========================
+# CHANGE JOURNAL
+# =========================
+JOURNAL_LIMIT = 50000
+
+
+class ChangeJournal:
+    # Sequence-numbered entity events: (seq, doc key, entity id, op) with op "create" / "update" / "delete",
+    # or entity id None and op "document" when a whole document was replaced. Views and the dirty indicator ask
+    # what changed since a sequence number; only the newest JOURNAL_LIMIT events are kept.
+    def __init__(self):
+        self.seq = 0
+        self._events = []
+        self._base = 0  # seq of the event before _events[0]
+        self._saved = {}  # doc key -> seq when it was last loaded or saved
+        self._documents = {}  # doc key -> seq of its last whole-document change
+        self._versions = {}  # doc key -> {entity id: seq of its last event} since then
+
+    def record(self, key: str, eid, op: str) -> int:
+        self.seq += 1
+        self._events.append((self.seq, key, eid, op))
+        if op == "document":
+            self._documents[key] = self.seq
+            self._versions[key] = {}
+        else:
+            self._versions.setdefault(key, {})[eid] = self.seq
+        if len(self._events) > JOURNAL_LIMIT:
+            drop = len(self._events) - JOURNAL_LIMIT
+            self._base = self._events[drop - 1][0]
+            del self._events[:drop]
+        return self.seq
+
+    def events(self, since: int):
+        # -> events after since, or None when they are no longer all kept
+        if since < self._base:
+            return None
+        return self._events[since - self._base:]
+
+    def touched(self, since: int, key: str):
+        # -> ids of key's entities changed after since, or None if the whole document was (or may have been)
+        events = self.events(since)
+        if events is None:
+            return None
+        ids = set()
+        for _seq, k, eid, op in events:
+            if k != key:
+                continue
+            if op == "document":
+                return None
+            ids.add(eid)
+        return ids
+
+    def version(self, key: str, eid) -> int:
+        # -> seq of the newest event that may have changed the entity; unlike events() this is never trimmed
+        return self._versions.get(key, {}).get(eid) or self._documents.get(key, 0)
+
+    def mark_saved(self, key: str):
+        self._saved[key] = self.seq
+
+    def unsaved(self, key: str):
+        # -> number of entities changed since key was last saved, or None after a whole-document change
+        return self.touched(self._saved.get(key, 0), key)
+
+
+# =========================
+# UNDO HISTORY
+# =========================
+UNDO_HISTORY_MB = 32
+
+
+def approx_size(obj) -> int:
+    # Rough bytes retained by a parsed value (shared strings are counted each time they appear).
+    if type(obj) is PendingEntity:
+        return sys.getsizeof(obj) + obj.end - obj.start
+    size = sys.getsizeof(obj)
+    if isinstance(obj, Entity):
+        # the key tuple is shared with every entity of the same shape
+        return size + sys.getsizeof(obj._values) + sum(approx_size(v) for v in obj._values)
+    if isinstance(obj, dict):
+        for k, v in dict.items(obj):
+            size += approx_size(k) + approx_size(v)
+    elif isinstance(obj, list):
+        for v in obj:
+            size += approx_size(v)
+    return size
+
+
+def undo_cost(change) -> int:
+    # What keeping a change costs beyond the live state: the values it alone still references.
+    key, eid, before, after, _pos = change
+    if eid is not None:
+        return 64 + (approx_size(before) if before is not _MISSING else 0)
+    ckey = ENTITY_COLLECTIONS[key]
+    cost = sys.getsizeof(before) + sys.getsizeof(after)
+    old, new = before, after
+    if ckey:
+        old = before.get(ckey) if isinstance(before.get(ckey), dict) else {}
+        new = after.get(ckey) if isinstance(after.get(ckey), dict) else {}
+        cost += sys.getsizeof(old) + sys.getsizeof(new)
+    for eid, value in dict.items(old):
+        if dict.get(new, eid) is not value:
+            cost += approx_size(value)
+    return cost
+
+
+def insert_at(coll: dict, pos: int, key, value):
+    # Puts key at position pos in place; dicts only append, so the keys after pos are re-added behind it.
+    # Values are moved as stored (pending entities stay unparsed).
+    tail = [(k, dict.__getitem__(coll, k)) for k in list(coll)[pos:]]
+    for k, _v in tail:
+        dict.__delitem__(coll, k)
+    dict.__setitem__(coll, key, value)
+    for k, v in tail:
+        dict.__setitem__(coll, k, v)
+
+
+class UndoHistory:
+    # Steps are lists of (doc key, entity id, before, after, position); entity id None means whole-document
+    # snapshots, position is where a deleted entity sat so undo can put it back there (else None).
+    # Values are shared with the live state, which editors replace instead of mutating, so a step
+    # costs only what it changed.
+    def __init__(self, budget=UNDO_HISTORY_MB * 1024 * 1024):
+        self.budget = budget
+        self.done = deque()  # (changes, cost)
+        self.undone = []
+        self.cost = 0
+
+    def __len__(self):
+        return len(self.done)
+
+    def push(self, changes, cost):
+        for _changes, dropped in self.undone:
+            self.cost -= dropped
+        self.undone.clear()
+        self.done.append((changes, cost))
+        self.cost += cost
+        self.trim()
+
+    def trim(self):
+        # the newest step is always kept, however large
+        while len(self.done) > 1 and self.cost > self.budget:
+            _changes, cost = self.done.popleft()
+            self.cost -= cost
+
+    def undo(self):
+        if not self.done:
+            return None
+        step = self.done.pop()
+        self.undone.append(step)
+        return step[0]
+
+    def redo(self):
+        if not self.undone:
+            return None
+        step = self.undone.pop()
+        self.done.append(step)
+        return step[0]
+
+    def clear(self):
+        self.done.clear()
+        self.undone.clear()
+        self.cost = 0
+
+
+# =========================
+# STRING INTERNING
+# =========================
+class InternStats:
+    __slots__ = ("strings", "shared", "bytes_saved")
+
+    def __init__(self):
+        self.strings = 0
+        self.shared = 0
+        self.bytes_saved = 0
+
+    def add(self, other):
+        self.strings += other.strings
+        self.shared += other.shared
+        self.bytes_saved += other.bytes_saved
+
+    def __str__(self):
+        return f"{self.shared}/{self.strings} strings shared, {self.bytes_saved / 1e6:.2f} MB saved"
+
+
+def intern_tree(obj, stats: InternStats | None = None):
+    # Swaps every string key/value of a plain YAML tree for its sys.intern() instance, so repeated lore lines,
+    # commands, materials and field names share one object (and compare by identity). Mappings are rebuilt,
+    # so use the return value; LazyEntities are updated in place and their pending spans are left alone.
+    intern = sys.intern
+    getsizeof = sys.getsizeof
+
+    def walk(v):
+        cls = type(v)
+        if cls is str:
+            s = intern(v)
+            if stats is not None:
+                stats.strings += 1
+                if s is not v:
+                    stats.shared += 1
+                    stats.bytes_saved += getsizeof(v)
+            return s
+        if cls is dict:
+            return {walk(k): walk(x) for k, x in v.items()}
+        if cls is list:
+            return [walk(x) for x in v]
+        if cls is LazyEntities:
+            for k, x in dict.items(v):
+                if type(x) is not PendingEntity:
+                    dict.__setitem__(v, k, walk(x))
+        elif isinstance(v, Entity):
+            return v._new(v._keys, tuple(walk(x) for x in v._values))
+        return v
+
+    return walk(obj)
+
+
+# =========================
+# INDEXES
+# =========================
+ID_INDEX_INSORT_MAX = 32  # pending adds placed one by one; more than this are sorted in with one sort
+
+
+class IdIndex:
+    # The ids of one collection in numeric_sort_key order (ties keep insertion order, like a stable sort of
+    # the dict's keys) plus the numeric ids on their own, so listing is sort-free and a new id is the last + 1.
+    def __init__(self):
+        self.source = None  # the collection this index was built from
+        self._order = []  # sorted (sort key, insertion seq, id)
+        self._entries = {}  # id -> its tuple in _order (or _added)
+        self._numbers = []
+        # adds are collected until the order is next needed; a few are insorted, a bulk add or a rebuild is
+        # sorted in one go instead of shifting the list once per id
+        self._added = []
+        self._seq = 0
+        self._listing = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, eid):
+        return eid in self._entries
+
+    def rebuild(self, coll):
+        self._order = []
+        self._entries = {}
+        self._numbers = []
+        self._added = []
+        self._listing = None
+        for eid in coll:
+            self.add(eid)
+        self.source = coll
+
+    def add(self, eid):
+        if eid in self._entries:
+            return
+        entry = (numeric_sort_key(eid), self._seq, eid)
+        self._seq += 1
+        self._entries[eid] = entry
+        self._listing = None
+        self._added.append(entry)
+
+    def _merge(self):
+        added = self._added
+        if not added:
+            return
+        self._added = []
+        numbers = []
+        for entry in added:
+            try:
+                numbers.append(int(str(entry[2])))
+            except ValueError:
+                pass
+        if len(added) <= ID_INDEX_INSORT_MAX:
+            for entry in added:
+                bisect.insort(self._order, entry)
+            for number in numbers:
+                bisect.insort(self._numbers, number)
+            return
+        self._order += added
+        self._order.sort()
+        self._numbers += numbers
+        self._numbers.sort()
+
+    def discard(self, eid):
+        entry = self._entries.pop(eid, None)
+        if entry is None:
+            return
+        self._merge()
+        self._listing = None
+        del self._order[bisect.bisect_left(self._order, entry)]
+        try:
+            number = int(str(eid))
+        except ValueError:
+            return
+        del self._numbers[bisect.bisect_left(self._numbers, number)]
+
+    def ordered(self) -> list:
+        # shared until the next add/discard; callers only iterate it
+        if self._listing is None:
+            self._merge()
+            self._listing = [entry[2] for entry in self._order]
+        return self._listing
+
+    def next_id(self) -> str:
+        # same rule as next_numeric_string_id: one past the largest numeric id, freed ids are not reused
+        self._merge()
+        return str(self._numbers[-1] + 1) if self._numbers else "1"
+
+
+class GroupIndex:
+    # reward group -> IdIndex of its rewards ("" holds the ungrouped ones), so the group filter's values and
+    # a filtered listing come from here instead of a scan over every reward.
+    def __init__(self):
+        self.source = None
+        self._group_of = {}
+        self._members = {}
+        self._names = None
+
+    def __len__(self):
+        return len(self._group_of)
+
+    def rebuild(self, rewards):
+        self._group_of = {}
+        self._members = {}
+        self._names = None
+        for rid in rewards:
+            self.set(rid, entity_column(rewards, rid, "group"))
+        self.source = rewards
+
+    def set(self, rid, group):
+        group = str(group).strip()
+        old = self._group_of.get(rid)
+        if old == group:
+            return
+        if old is not None:
+            self.discard(rid)
+        self._group_of[rid] = group
+        members = self._members.get(group)
+        if members is None:
+            members = self._members[group] = IdIndex()
+            self._names = None
+        members.add(rid)
+
+    def discard(self, rid):
+        group = self._group_of.pop(rid, None)
+        if group is None:
+            return
+        members = self._members[group]
+        members.discard(rid)
+        if not len(members):
+            del self._members[group]
+            self._names = None
+
+    def groups(self) -> list:
+        if self._names is None:
+            self._names = sorted(g for g in self._members if g)
+        return self._names
+
+    def ordered(self, group) -> list:
+        members = self._members.get(str(group).strip())
+        return members.ordered() if members is not None else []
+
+
+def tier_reward_ids(tier) -> list[str]:
+    return [str(x) for x in ensure_list(ensure_dict(tier).get("rewards", []))]
+
+
+class ReferenceIndex:
+    # reward id -> {(track, tier id)}, kept up to date per tier edit so "where used" lookups, delete checks
+    # and id remaps cost the number of references rather than a walk over both tracks.
+    def __init__(self):
+        self._users = {}
+        self._tiers = {}  # track -> {tier id: tuple of reward ids}
+
+    def set_tier(self, track: str, tid, rewards=()):
+        # rewards=() (or a missing tier) drops the tier's references
+        tid = str(tid)
+        tiers = self._tiers.setdefault(track, {})
+        new = tuple(dict.fromkeys(str(r) for r in rewards))
+        old = tiers.pop(tid, ())
+        ref = (track, tid)
+        for rid in old:
+            users = self._users.get(rid)
+            if users is not None:
+                users.discard(ref)
+                if not users:
+                    del self._users[rid]
+        if new:
+            tiers[tid] = new
+            for rid in new:
+                self._users.setdefault(rid, set()).add(ref)
+
+    def set_track(self, track: str, tiers):
+        for tid in list(self._tiers.get(track, ())):
+            self.set_tier(track, tid)
+        for tid, tier in ensure_dict(tiers).items():
+            self.set_tier(track, tid, tier_reward_ids(tier))
+
+    def users(self, rid) -> set:
+        return set(self._users.get(str(rid), ()))
+
+    def is_referenced(self, rid) -> bool:
+        return str(rid) in self._users
+
+
 # =========================
 # GENERATORS
 # =========================
@@ -152,7 +1504,7 @@ CRAFT_ITEMS = ["bread", "torch", "glass", "chest", "oak_planks", "stone_bricks"]
 SMELT_ITEMS = ["iron_ingot", "gold_ingot", "glass", "charcoal"]
 
 
-def gen_reward_command():
+def gen_reward_command(rng=random):
     bundles = [
         {
             "name": "Food Bundle",
@@ -180,7 +1532,7 @@ def gen_reward_command():
             ],
         },
     ]
-    bundle = random.choice(bundles)
+    bundle = rng.choice(bundles)
     return {
         "name": bundle["name"],
         "type": "command",
@@ -189,9 +1541,9 @@ def gen_reward_command():
     }
 
 
-def gen_reward_xp():
-    mode = random.choice(["levels", "points"])
-    amount = random.choice([3, 5, 8, 12, 15, 20]) if mode == "levels" else random.choice([50, 75, 100, 150, 200, 250])
+def gen_reward_xp(rng=random):
+    mode = rng.choice(["levels", "points"])
+    amount = rng.choice([3, 5, 8, 12, 15, 20]) if mode == "levels" else rng.choice([50, 75, 100, 150, 200, 250])
     name = f"XP Reward ({amount} {'Levels' if mode == 'levels' else 'Points'})"
     return {
         "name": name,
@@ -201,21 +1553,21 @@ def gen_reward_xp():
     }
 
 
-def gen_reward_item():
-    mat = random.choice(MATERIALS)
-    amt = random.choice([1, 1, 2, 3, 5, 8, 16])
-    name = random.choice(["Loot Pack", "Miner Kit", "Builder Bundle", "Explorer Bundle", "Treasure Drop", "Supply Cache"])
+def gen_reward_item(rng=random):
+    mat = rng.choice(MATERIALS)
+    amt = rng.choice([1, 1, 2, 3, 5, 8, 16])
+    name = rng.choice(["Loot Pack", "Miner Kit", "Builder Bundle", "Explorer Bundle", "Treasure Drop", "Supply Cache"])
     lore = [
         "&7Auto-generated item reward.",
         "&7Contains: &f{0}x &f{1}".format(amt, mat.split(":")[0].replace("_", " ").title()),
     ]
     item = {"material": mat, "amount": amt, "name": "&b" + name, "lore": lore}
-    if random.random() < 0.25:
+    if rng.random() < 0.25:
         item["glow"] = True
     return {"name": name, "type": "item", "items": {"1": item}, "lore-addon": ["&7Auto-generated reward."]}
 
 
-def gen_random_reward(allowed_types=None):
+def gen_random_reward(allowed_types=None, rng=random):
     type_weights = {
         "item": 0.4,
         "xp": 0.35,
@@ -227,60 +1579,62 @@ def gen_random_reward(allowed_types=None):
         choices = list(type_weights.keys())
     if not choices:
         choices = list(type_weights.keys())
-    pick = random.choices(choices, weights=[type_weights[t] for t in choices], k=1)[0]
+    pick = rng.choices(choices, weights=[type_weights[t] for t in choices], k=1)[0]
     if pick == "item":
-        return gen_reward_item()
-    if pick == "xp":
-        return gen_reward_xp()
-    return gen_reward_command()
+        reward = gen_reward_item(rng)
+    elif pick == "xp":
+        reward = gen_reward_xp(rng)
+    else:
+        reward = gen_reward_command(rng)
+    return intern_tree(reward)
 
 
-def gen_random_quest():
-    qtype = random.choice(["block-break", "fish", "craft-item", "smelt-item", "harvest", "playtime", "explore"])
+def gen_random_quest(rng=random):
+    qtype = rng.choice(["block-break", "fish", "craft-item", "smelt-item", "harvest", "playtime", "explore"])
     if qtype == "block-break":
-        blk = random.choice(BLOCKS)
-        need = random.choice([16, 32, 64, 128])
-        points = random.choice([10, 15, 20, 25])
+        blk = rng.choice(BLOCKS)
+        need = rng.choice([16, 32, 64, 128])
+        points = rng.choice([10, 15, 20, 25])
         name = "&eMine &f{0} &e{1}".format(need, blk.replace("_", " ").title())
         variable = blk
         item_mat = "iron_pickaxe:0"
     elif qtype == "fish":
-        fish = random.choice(FISH)
-        need = random.choice([5, 10, 15, 20])
-        points = random.choice([10, 15, 20, 25])
+        fish = rng.choice(FISH)
+        need = rng.choice([5, 10, 15, 20])
+        points = rng.choice([10, 15, 20, 25])
         name = "&eCatch &f{0} &e{1}".format(need, fish.replace("_", " ").title())
         variable = fish
         item_mat = "fishing_rod:0"
     elif qtype == "craft-item":
-        mat = random.choice(CRAFT_ITEMS)
-        need = random.choice([4, 8, 16, 24, 32])
-        points = random.choice([10, 15, 20, 25, 30])
+        mat = rng.choice(CRAFT_ITEMS)
+        need = rng.choice([4, 8, 16, 24, 32])
+        points = rng.choice([10, 15, 20, 25, 30])
         name = "&eCraft &f{0} &e{1}".format(need, mat.replace("_", " ").title())
         variable = mat
         item_mat = "crafting_table:0"
     elif qtype == "smelt-item":
-        mat = random.choice(SMELT_ITEMS)
-        need = random.choice([8, 16, 24, 32])
-        points = random.choice([10, 15, 20, 25])
+        mat = rng.choice(SMELT_ITEMS)
+        need = rng.choice([8, 16, 24, 32])
+        points = rng.choice([10, 15, 20, 25])
         name = "&eSmelt &f{0} &e{1}".format(need, mat.replace("_", " ").title())
         variable = mat
         item_mat = "furnace:0"
     elif qtype == "harvest":
-        crop = random.choice(CROPS)
-        need = random.choice([16, 32, 48, 64])
-        points = random.choice([10, 15, 20, 25])
+        crop = rng.choice(CROPS)
+        need = rng.choice([16, 32, 48, 64])
+        points = rng.choice([10, 15, 20, 25])
         name = "&eHarvest &f{0} &e{1}".format(need, crop.replace("_", " ").title())
         variable = crop
         item_mat = "iron_hoe:0"
     elif qtype == "playtime":
-        need = random.choice([10, 20, 30, 45, 60])
-        points = random.choice([10, 15, 20, 25, 30])
+        need = rng.choice([10, 20, 30, 45, 60])
+        points = rng.choice([10, 15, 20, 25, 30])
         name = "&ePlay for &f{0} &eminutes".format(need)
         variable = "minutes"
         item_mat = "clock:0"
     else:
-        need = random.choice([500, 1000, 1500, 2000])
-        points = random.choice([10, 15, 20, 25, 30])
+        need = rng.choice([500, 1000, 1500, 2000])
+        points = rng.choice([10, 15, 20, 25, 30])
         name = "&eExplore &f{0} &eblocks".format(need)
         variable = "distance"
         item_mat = "compass:0"
@@ -291,24 +1645,21 @@ def gen_random_quest():
         "",
         "&7Points: &f%points%",
     ]
-    return {
+    return intern_tree({
         "name": name,
         "type": qtype,
         "variable": variable,
         "required-progress": int(need),
         "points": int(points),
         "item": {"material": item_mat, "name": name, "lore": lore},
-    }
+    })
 
 
 # =========================
 # EMOJIS (REWARD)
 # =========================
-def reward_emoji(reward: dict) -> str:
-    r = ensure_dict(reward)
-    t = str(r.get("type", "")).lower()
-    name = str(r.get("name", "")).lower()
-
+def emoji_for(t: str, name: str, mat: str, glow: bool) -> str:
+    # t, name and mat are already lower-cased
     if t == "xp":
         return "🧪"
     if t == "command":
@@ -318,30 +1669,234 @@ def reward_emoji(reward: dict) -> str:
             return "⭐"
         return "⚙️"
     if t == "item":
-        items = ensure_dict(r.get("items", {}))
-        it = ensure_dict(items.get("1", {}))
-        mat = str(it.get("material", "")).lower()
-        glow = bool(it.get("glow", False))
-        if "sword" in mat or "axe" in mat:
-            emoji = "🗡️"
-        elif "pickaxe" in mat or "shovel" in mat or "hoe" in mat:
-            emoji = "⛏️"
-        elif "chestplate" in mat or "helmet" in mat or "leggings" in mat or "boots" in mat:
-            emoji = "🛡️"
-        elif "elytra" in mat:
-            emoji = "🪽"
-        elif "totem" in mat:
-            emoji = "🗿"
-        elif "apple" in mat:
-            emoji = "🍎"
-        elif "pearl" in mat:
-            emoji = "🧿"
-        else:
-            emoji = "🎁"
+        emoji = MATERIAL_EMOJI.get(mat) or material_emoji(mat)
         return f"✨{emoji}" if glow else emoji
     return "🎁"
 
 
+# first matching substring wins, so "pickaxe" lands on the sword rule through "axe"
+ITEM_EMOJI_RULES = (
+    (("sword", "axe"), "🗡️"),
+    (("pickaxe", "shovel", "hoe"), "⛏️"),
+    (("chestplate", "helmet", "leggings", "boots"), "🛡️"),
+    (("elytra",), "🪽"),
+    (("totem",), "🗿"),
+    (("apple",), "🍎"),
+    (("pearl",), "🧿"),
+)
+MATERIAL_EMOJI = {}  # lower-cased material -> emoji, each material matched against the rules once
+
+
+def material_emoji(mat: str) -> str:
+    emoji = next((e for words, e in ITEM_EMOJI_RULES if any(w in mat for w in words)), "🎁")
+    MATERIAL_EMOJI[mat] = emoji
+    return emoji
+
+
+for _mat in MATERIALS:
+    material_emoji(_mat.lower())
+
+
+# =========================
+# MODEL
+# =========================
+# Rewards and tiers are stored as Entity objects instead of dicts. An entity holds only its values; the key
+# tuple is shared by every entity with the same keys in the same order, so a reward costs one small object and
+# one tuple rather than a dict table. Any key round-trips, known or not, in its original order, and an entity
+# reads, writes, compares and repr()s like the dict it replaces, which is all the editors, the signatures and
+# the dumpers need. Mappings nested in an entity (a reward's items) become plain Entity objects the same way;
+# lists stay lists, and quests and weeks stay plain dicts.
+_MISSING = object()
+_ENTITY_KEYS = {}  # key tuple -> its shared instance
+
+
+def entity_keys(keys: tuple) -> tuple:
+    shared = _ENTITY_KEYS.get(keys)
+    if shared is None:
+        shared = _ENTITY_KEYS.setdefault(keys, tuple(sys.intern(k) if type(k) is str else k for k in keys))
+    return shared
+
+
+class Entity(MutableMapping):
+    __slots__ = ("_keys", "_values")
+
+    def __init__(self, data=()):
+        if not isinstance(data, (dict, Entity)):
+            data = dict(data)
+        self._keys = entity_keys(tuple(data.keys()))
+        self._values = tuple(Entity(v) if type(v) is dict else v for v in data.values())
+        self._changed()
+
+    @classmethod
+    def adopt(cls, value):
+        # the stored form of a parsed or edited value; anything but a plain mapping is kept as it is
+        return cls(value) if type(value) is dict else value
+
+    @classmethod
+    def _new(cls, keys, values):
+        obj = cls.__new__(cls)
+        obj._keys = keys
+        obj._values = values
+        obj._changed()
+        return obj
+
+    def _changed(self):
+        pass
+
+    def __getitem__(self, key):
+        try:
+            return self._values[self._keys.index(key)]
+        except ValueError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        keys = self._keys
+        return self._values[keys.index(key)] if key in keys else default
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __setitem__(self, key, value):
+        keys = self._keys
+        if key in keys:
+            i = keys.index(key)
+            self._values = self._values[:i] + (value,) + self._values[i + 1:]
+        else:
+            self._keys = entity_keys(keys + (key,))
+            self._values += (value,)
+        self._changed()
+
+    def __delitem__(self, key):
+        keys = self._keys
+        if key not in keys:
+            raise KeyError(key)
+        i = keys.index(key)
+        self._keys = entity_keys(keys[:i] + keys[i + 1:])
+        self._values = self._values[:i] + self._values[i + 1:]
+        self._changed()
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def keys(self):
+        return list(self._keys)
+
+    def values(self):
+        return list(self._values)
+
+    def items(self):
+        return list(zip(self._keys, self._values))
+
+    def to_dict(self) -> dict:
+        return dict(zip(self._keys, self._values))
+
+    def copy(self):
+        return self._new(self._keys, self._values)
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo):
+        return self._new(self._keys, copy.deepcopy(self._values, memo))
+
+    def __eq__(self, other):
+        if isinstance(other, Entity):
+            other = other.to_dict()
+        return self.to_dict() == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+
+class Reward(Entity):
+    __slots__ = ("_look",)  # (kind, emoji, glow) once the preview asked for them; any write drops it
+
+    def _changed(self):
+        self._look = None
+
+    @classmethod
+    def view(cls, value):
+        # what the preview reads: a stored reward as it is, anything else (missing, not adopted yet) via a copy
+        return value if type(value) is cls else cls(ensure_dict(value))
+
+    def _looks(self):
+        look = self._look
+        if look is None:
+            it = ensure_dict(ensure_dict(self.get("items", {})).get("1", {}))
+            kind = str(self.get("type", "")).lower()
+            glow = bool(it.get("glow", False))
+            emoji = emoji_for(kind, str(self.get("name", "")).lower(), str(it.get("material", "")).lower(), glow)
+            look = self._look = (kind, emoji, glow)
+        return look
+
+    @property
+    def kind(self) -> str:
+        return self._looks()[0]
+
+    @property
+    def emoji(self) -> str:
+        return self._looks()[1]
+
+    @property
+    def glow(self) -> bool:
+        return self._looks()[2]
+
+    def label(self, rid) -> str:
+        name = self.get("name", _MISSING)
+        return f"{self.emoji} {name if name is not _MISSING else f'Reward {rid}'}"
+
+
+class Tier(Entity):
+    __slots__ = ()
+
+    @classmethod
+    def view(cls, value):
+        return value if type(value) is cls else cls(ensure_dict(value))
+
+    @property
+    def reward_ids(self) -> tuple:
+        return tuple(str(v) for v in ensure_list(self.get("rewards")))
+
+    @property
+    def points(self) -> int:
+        try:
+            return int(self.get("required-points", 0))
+        except Exception:
+            return 0
+
+
+ENTITY_TYPES = {"": Reward, "tiers": Tier}  # collection key (see ENTITY_COLLECTIONS) -> stored entity class
+
+
+def adopt_entities(data, collection):
+    # swaps a loaded document's reward or tier mappings for entities, in place; pending ones adopt on parse
+    cls = ENTITY_TYPES.get(collection)
+    coll = data if collection == "" else ensure_dict(data).get(collection)
+    if cls is None or not isinstance(coll, dict):
+        return data
+    for eid, value in dict.items(coll):
+        if type(value) is dict:
+            dict.__setitem__(coll, eid, cls(value))
+    return data
+
+
+def plain_entities(data, collection):
+    # the same document with its entities as dicts again, for marshal; data itself is left alone
+    coll = data if collection == "" else ensure_dict(data).get(collection)
+    if collection not in ENTITY_TYPES or not isinstance(coll, dict):
+        return data
+    plain = {eid: v.to_dict() if isinstance(v, Entity) else v for eid, v in dict.items(coll)}
+    return plain if collection == "" else {**data, collection: plain}
+
+
+for _dumper in {yaml.SafeDumper, *(dumper for _loader, dumper in YAML_BACKENDS.values())}:
+    _dumper.add_multi_representer(Entity, lambda dumper, data: dumper.represent_dict(data))
+
+
 # =========================
 # TOOLTIP
 # =========================
@@ -407,12 +1962,489 @@ class ScrollableFrame(ttk.Frame):
             pass
 
 
+# =========================
+# VIRTUAL LIST
+# =========================
+VIRTUAL_OVERSCAN = 4  # extra rows materialized below the visible ones
+VIRTUAL_ROW_HEIGHT = 20  # used only when neither a rendered row nor the style gives one
+
+
+def diff_rows(shown, wanted):
+    # Widget calls that turn the shown rows into the wanted ones; both are [(iid, values)] in display order.
+    # -> [("delete", iid) | ("insert", pos, iid, values) | ("item", iid, values) | ("move", iid, pos)]
+    keep = {iid for iid, _values in wanted}
+    ops = [("delete", iid) for iid, _values in shown if iid not in keep]
+    current = {iid: values for iid, values in shown if iid in keep}
+    order = [iid for iid, _values in shown if iid in keep]
+    placed = set()
+    i = 0
+    for pos, (iid, values) in enumerate(wanted):
+        # rows before pos are already in place, so the next unplaced shown row sits at pos
+        while i < len(order) and order[i] in placed:
+            i += 1
+        if iid not in current:
+            ops.append(("insert", pos, iid, values))
+        else:
+            if current[iid] != values:
+                ops.append(("item", iid, values))
+            if i < len(order) and order[i] == iid:
+                i += 1
+            else:
+                ops.append(("move", iid, pos))
+        placed.add(iid)
+    return ops
+
+
+class VirtualTreeview(ttk.Treeview):
+    # A Treeview over a full id list that only materializes the visible rows (plus overscan), pulling
+    # values from a row callback. get_children/index/move/exists/selection/see work on the full list,
+    # so callers treat it like a plain Treeview holding every row.
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, **kwargs)
+        self._ids = []
+        self._pos = {}  # str(id) -> index in _ids, kept current with it
+        self._row = lambda _eid: ()
+        self._top = 0
+        self._shown = []  # [(iid, values)] materialized, in display order
+        self._stale = set()  # shown iids whose values must be recomputed (None = all)
+        self._selected = ()
+        self._synced = ()  # the native selection as last set or seen by this class
+        self._select_handlers = []
+        self._notify_job = None
+        self.scrollbar = None
+        super().bind("<<TreeviewSelect>>", self._on_native_select)
+        super().bind("<Configure>", lambda _e: self._render())
+        super().bind("<MouseWheel>", self._on_wheel)
+        super().bind("<Button-4>", lambda _e: self._wheel_steps(-3))
+        super().bind("<Button-5>", lambda _e: self._wheel_steps(3))
+        for key, step in (("<Up>", -1), ("<Down>", 1)):
+            super().bind(key, lambda _e, s=step: self._step_selection(s))
+        for key, pages in (("<Prior>", -1), ("<Next>", 1)):
+            super().bind(key, lambda _e, p=pages: self._step_selection(p * self._visible_rows()))
+
+    def attach_scrollbar(self, scrollbar):
+        self.scrollbar = scrollbar
+        self._update_scrollbar()
+
+    def bind(self, sequence=None, func=None, add=None):
+        # selection changes are filtered here so re-rendering never looks like the user picking a row
+        if sequence == "<<TreeviewSelect>>" and func is not None:
+            if not add:
+                self._select_handlers = []
+            self._select_handlers.append(func)
+            return None
+        return super().bind(sequence, func, add)
+
+    def set_rows(self, ids, row, changed=None):
+        # changed: ids whose values may differ from what is shown (None = any of them)
+        ids = list(ids)
+        if ids != self._ids:
+            self._ids = ids
+            self._pos = {str(eid): i for i, eid in enumerate(ids)}
+        self._row = row
+        if changed is None or self._stale is None:
+            self._stale = None
+        else:
+            self._stale.update(str(eid) for eid in changed)
+        self._render()
+
+    # -- full-list view of the Treeview API
+    def get_children(self, item=None):
+        return tuple(str(eid) for eid in self._ids)
+
+    def exists(self, item):
+        return str(item) in self._pos
+
+    def index(self, item):
+        return self._pos[str(item)]
+
+    def move(self, item, parent, index):
+        pos = self._pos.get(str(item))
+        if pos is None:
+            return
+        eid = self._ids.pop(pos)
+        index = max(0, min(int(index), len(self._ids)))
+        self._ids.insert(index, eid)
+        # only the rows between the old and the new place changed position
+        for i in range(min(pos, index), max(pos, index) + 1):
+            self._pos[str(self._ids[i])] = i
+        self._render()
+
+    def delete(self, *items):
+        drop = {str(i) for i in items}
+        self._ids = [eid for eid in self._ids if str(eid) not in drop]
+        self._pos = {str(eid): i for i, eid in enumerate(self._ids)}
+        self._selected = tuple(i for i in self._selected if i not in drop)
+        self._render()
+
+    def selection(self):
+        return self._selected
+
+    def selection_set(self, *items):
+        if len(items) == 1 and isinstance(items[0], (list, tuple)):
+            items = items[0]
+        index = self._pos
+        self._selected = tuple(str(i) for i in items if str(i) in index)
+        self._sync_selection()
+        if self._notify_job is None:
+            self._notify_job = self.after_idle(self._notify_select)
+
+    def focus(self, item=None):
+        if item is None:
+            return super().focus()
+        if super().exists(str(item)):
+            super().focus(str(item))
+
+    def see(self, item):
+        pos = self._pos.get(str(item))
+        if pos is None:
+            return
+        rows = self._visible_rows()
+        if pos < self._top:
+            self._top = pos
+        elif pos >= self._top + rows:
+            self._top = pos - rows + 1
+        else:
+            return
+        self._render()
+
+    def yview(self, *args):
+        if not args:
+            return self._fractions()
+        if args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * len(self._ids)))
+        elif args[0] == "scroll":
+            step = self._visible_rows() if str(args[2]).startswith("page") else 1
+            self._scroll_to(self._top + int(args[1]) * step)
+        return None
+
+    # -- window management
+    def _visible_rows(self):
+        height = self.winfo_height()
+        if height <= 1:
+            return int(self.cget("height") or 10)
+        row_height, first_y = self._row_metrics()
+        return max(1, (height - first_y) // row_height)
+
+    def _row_metrics(self):
+        # (row height, y of the first row): measured on a rendered row when one is on screen, otherwise the
+        # style's rowheight below a heading assumed to be one row high
+        if self._shown:
+            box = super().bbox(self._shown[0][0])
+            if box and box[3] > 0:
+                return box[3], box[1]
+        try:
+            row_height = int(float(ttk.Style(self).lookup(self.cget("style") or "Treeview", "rowheight") or 0))
+        except (tk.TclError, ValueError):
+            row_height = 0
+        row_height = row_height or VIRTUAL_ROW_HEIGHT
+        return row_height, row_height if "headings" in str(self.cget("show")) else 0
+
+    def _scroll_to(self, top):
+        top = max(0, min(top, len(self._ids) - self._visible_rows()))
+        if top != self._top:
+            self._top = top
+            self._render()
+
+    def _render(self):
+        rows = self._visible_rows()
+        self._top = max(0, min(self._top, len(self._ids) - rows))
+        window = self._ids[self._top:self._top + rows + VIRTUAL_OVERSCAN]
+        shown = dict(self._shown)
+        stale = self._stale
+        wanted = []
+        for eid in window:
+            iid = str(eid)
+            values = shown.get(iid)
+            if values is None or stale is None or iid in stale:
+                values = tuple(self._row(eid))
+            wanted.append((iid, values))
+        for op in diff_rows(self._shown, wanted):
+            if op[0] == "delete":
+                super().delete(op[1])
+            elif op[0] == "insert":
+                super().insert("", op[1], iid=op[2], values=op[3])
+            elif op[0] == "item":
+                super().item(op[1], values=op[2])
+            else:
+                super().move(op[1], "", op[2])
+        self._shown = wanted
+        self._stale = set()
+        super().yview_moveto(0)
+        self._sync_selection()
+        self._update_scrollbar()
+
+    def _sync_selection(self):
+        shown = [iid for iid in self._selected if super().exists(iid)]
+        if list(super().selection()) != shown:
+            super().selection_set(shown)
+        self._synced = tuple(super().selection())
+
+    def _fractions(self):
+        total = len(self._ids)
+        if not total:
+            return 0.0, 1.0
+        return self._top / total, min(1.0, (self._top + self._visible_rows()) / total)
+
+    def _update_scrollbar(self):
+        if self.scrollbar is not None:
+            self.scrollbar.set(*self._fractions())
+
+    def _on_native_select(self, event):
+        native = tuple(super().selection())
+        if native == self._synced:
+            return
+        # a click or key inside the window; rows outside it keep no native selection
+        self._selected = native
+        self._synced = native
+        for handler in list(self._select_handlers):
+            handler(event)
+
+    def _notify_select(self):
+        self._notify_job = None
+        for handler in list(self._select_handlers):
+            handler(None)
+
+    def _on_wheel(self, event):
+        self._wheel_steps(int(-1 * (event.delta / 120)) * 3)
+        return "break"
+
+    def _wheel_steps(self, steps):
+        self._scroll_to(self._top + steps)
+        return "break"
+
+    def _step_selection(self, step):
+        if not self._ids:
+            return "break"
+        pos = self._pos.get(self._selected[0]) if self._selected else None
+        pos = 0 if pos is None else max(0, min(len(self._ids) - 1, pos + step))
+        iid = str(self._ids[pos])
+        self.selection_set(iid)
+        self.see(iid)
+        self.focus(iid)
+        return "break"
+
+
+# =========================
+# PREVIEW SUMMARIES
+# =========================
+# BattlePass preview geometry: one column per tier, premium row above free
+PREVIEW_PAD_X = 16
+PREVIEW_TILE = 56
+PREVIEW_GAP = 14
+PREVIEW_Y_PREMIUM = 40
+PREVIEW_Y_FREE = 120
+PREVIEW_OVERSCAN = 3  # columns drawn past each edge of the view
+PREVIEW_ROWS = (("premium", PREVIEW_Y_PREMIUM, PREM_COL), ("free", PREVIEW_Y_FREE, FREE_COL))
+PREVIEW_ZOOM_FACTOR = 4  # tiers per column multiply by this per zoom level
+MINIMAP_BARS = 160
+
+
+class TierSummary:
+    __slots__ = ("tiers", "rewards", "types", "low", "high")
+
+    def __init__(self, tiers=0, rewards=0, types=None, low=None, high=None):
+        self.tiers = tiers
+        self.rewards = rewards
+        self.types = types if types is not None else {}  # reward type -> count
+        self.low = low  # required-points span
+        self.high = high
+
+    @classmethod
+    def merge(cls, parts):
+        out = cls()
+        for part in parts:
+            if part is None:
+                continue
+            out.tiers += part.tiers
+            out.rewards += part.rewards
+            for kind, n in part.types.items():
+                out.types[kind] = out.types.get(kind, 0) + n
+            out.low = part.low if out.low is None else min(out.low, part.low)
+            out.high = part.high if out.high is None else max(out.high, part.high)
+        return out if out.tiers else None
+
+    def dominant(self) -> str:
+        return max(self.types, key=self.types.get) if self.types else ""
+
+    def span(self) -> str:
+        if self.low is None:
+            return ""
+        return str(self.low) if self.low == self.high else f"{self.low}-{self.high}"
+
+
+class TierSegments:
+    # Aggregates over the preview's tier columns. Level 0 holds one TierSummary (or None) per column and
+    # track; each level above merges PREVIEW_ZOOM_FACTOR neighbours of the one below, so a block at any zoom
+    # is a lookup and changing one tier rewrites one entry per level.
+    def __init__(self, leaves, factor=PREVIEW_ZOOM_FACTOR):
+        # leaves: {track: [TierSummary or None per column]}, all the same length
+        self.factor = factor
+        self.columns = 0
+        self.levels = {}
+        for track, row in leaves.items():
+            levels = [list(row)]
+            while len(levels[-1]) > 1:
+                below = levels[-1]
+                levels.append([TierSummary.merge(below[i:i + factor]) for i in range(0, len(below), factor)])
+            self.levels[track] = levels
+            self.columns = len(row)
+
+    @property
+    def depth(self) -> int:
+        return max((len(levels) for levels in self.levels.values()), default=1)
+
+    def count(self, level: int) -> int:
+        size = self.factor ** level
+        return (self.columns + size - 1) // size
+
+    def block(self, track: str, level: int, index: int):
+        levels = self.levels[track]
+        if level >= len(levels) or index >= len(levels[level]):
+            return None
+        return levels[level][index]
+
+    def update(self, track: str, col: int, leaf):
+        levels = self.levels[track]
+        levels[0][col] = leaf
+        index = col
+        for level in range(1, len(levels)):
+            index //= self.factor
+            start = index * self.factor
+            levels[level][index] = TierSummary.merge(levels[level - 1][start:start + self.factor])
+
+    def insert(self, col: int, leaves):
+        # leaves: {track: TierSummary or None} of a new column at col
+        for track, leaf in leaves.items():
+            self.levels[track][0].insert(col, leaf)
+        self.columns += 1
+        self._remerge(col)
+
+    def remove(self, col: int):
+        for levels in self.levels.values():
+            del levels[0][col]
+        self.columns -= 1
+        self._remerge(col)
+
+    def _remerge(self, col: int):
+        # the columns from col on shifted, so every block from the one holding col to the end is merged again
+        factor = self.factor
+        for levels in self.levels.values():
+            index = col
+            level = 1
+            while len(levels[level - 1]) > 1:
+                index //= factor
+                if level == len(levels):
+                    levels.append([])
+                    index = 0
+                below = levels[level - 1]
+                del levels[level][index:]
+                levels[level].extend(TierSummary.merge(below[i:i + factor]) for i in range(index * factor, len(below), factor))
+                level += 1
+            del levels[level:]
+
+
+# =========================
+# TILE SPRITES
+# =========================
+SPRITE_EMOJI_FONTS = ("seguiemj.ttf", "Apple Color Emoji.ttc", "NotoColorEmoji.ttf")
+SPRITE_FONT_SIZE = 28
+# colour bitmap fonts (CBDT / sbix, e.g. Noto Color Emoji) only load at the sizes they carry strikes for
+SPRITE_BITMAP_SIZES = (109, 160, 96, 64, 48, 40, 32, 20)
+SPRITE_PROBE = "🎁"
+SPRITE_CACHE_LIMIT = 512
+SPRITE_GLOW = "#fff3b0"
+
+
+class TileSprites:
+    # Pre-rendered preview tiles keyed by (fill colour, emoji text, glow); identical tiles share one
+    # PhotoImage, so the canvas never shapes emoji text. Needs Pillow and a colour emoji font: check available
+    # before use. The newest SPRITE_CACHE_LIMIT images are kept, so callers hold on to the ones they display.
+    def __init__(self, master, size=PREVIEW_TILE):
+        self.master = master
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._images = OrderedDict()
+        self._font = None  # None until looked up, False when no usable font was found
+
+    @property
+    def available(self) -> bool:
+        if self._font is None:
+            self._font = self._load_font() if Image is not None else False
+        return self._font is not False
+
+    def __len__(self):
+        return len(self._images)
+
+    def get(self, fill: str, text: str, glow: bool = False):
+        key = (fill, text, glow)
+        image = self._images.get(key)
+        if image is None:
+            self.misses += 1
+            image = self._images[key] = self._render(fill, text, glow)
+            if len(self._images) > SPRITE_CACHE_LIMIT:
+                self._images.popitem(last=False)
+        else:
+            self.hits += 1
+            self._images.move_to_end(key)
+        return image
+
+    def _load_font(self):
+        # Pillow has no font fallback: a font without colour emoji draws blanks or tofu where Tk's text
+        # rendering would switch fonts, so only a font that draws the probe in colour is used.
+        for name in SPRITE_EMOJI_FONTS:
+            for size in (SPRITE_FONT_SIZE, *SPRITE_BITMAP_SIZES):
+                try:
+                    font = ImageFont.truetype(name, size)
+                except Exception:
+                    continue
+                if draws_colour(font, SPRITE_PROBE):
+                    return font
+                break
+        return False
+
+    def _render(self, fill, text, glow):
+        return ImageTk.PhotoImage(self._draw(fill, text, glow), master=self.master)
+
+    def _draw(self, fill, text, glow):
+        size = self.size
+        tile = Image.new("RGBA", (size, size), fill)
+        draw = ImageDraw.Draw(tile)
+        if glow:
+            draw.rectangle((1, 1, size - 2, size - 2), outline=SPRITE_GLOW, width=3)
+        left, top, right, bottom = draw.textbbox((0, 0), text, font=self._font, embedded_color=True)
+        layer = Image.new("RGBA", (max(1, right - left), max(1, bottom - top)), (0, 0, 0, 0))
+        ImageDraw.Draw(layer).text((-left, -top), text, font=self._font, embedded_color=True)
+        # several rewards on one tier are shrunk to fit instead of spilling over the tile
+        room = size - 8
+        scale = min(1.0, room / layer.width, room / layer.height)
+        if scale < 1.0:
+            layer = layer.resize((max(1, int(layer.width * scale)), max(1, int(layer.height * scale))), Image.LANCZOS)
+        tile.alpha_composite(layer, ((size - layer.width) // 2, (size - layer.height) // 2))
+        return tile
+
+
+def draws_colour(font, text: str) -> bool:
+    try:
+        left, top, right, bottom = font.getbbox(text)
+        layer = Image.new("RGB", (max(1, right), max(1, bottom)))
+        ImageDraw.Draw(layer).text((0, 0), text, font=font, embedded_color=True)
+    except Exception:
+        return False
+    return layer.convert("HSV").getchannel("S").getextrema()[1] > 0
+
+
 # =========================
 # MAIN APP
 # =========================
+REDRAW_ORDER = ("rewards", "tiers", "quests", "preview_battlepass", "preview_quests")
+
+
 class BattlePassStudio(tk.Tk):
     def __init__(self):
         super().__init__()
+        self.sprites = TileSprites(self)
         self.title("BattlePass Studio")
         self.geometry("1550x860")
         self.minsize(1400, 780)
@@ -430,6 +2462,47 @@ class BattlePassStudio(tk.Tk):
             "week_pool_path": "",
         }
         self.dirty = {"free": False, "premium": False, "rewards": False, "quests": False, "week_pool": False}
+        self.doc_versions = {key: 0 for key in self.dirty}
+        self.journal = ChangeJournal()
+        # treeview widget name -> (journal seq, what it was showing) at its last refresh
+        self._view_seqs = {}
+        self._dirty_views = set()
+        self._redraw_job = None
+        self._limits_seq = {}  # track -> journal seq its tier reward limits were last checked at
+        # doc key -> {entity id (None = whole document): journal seq} of values put back by undo / redo
+        self._undo_restored = {}
+        self._preview_ids = []  # tier id of each preview column
+        self._preview_pos = {}  # tier id -> column
+        self._preview_drawn = set()  # tier ids whose column is on the canvas
+        self._preview_tiles = {}  # (track, tier id) -> (rect, text) canvas items
+        self._preview_labels = {}  # tier id -> label item under the column
+        self._preview_hits = {}  # tile canvas item -> (track, tier id)
+        self._preview_images = {}  # sprite canvas item -> the PhotoImage it shows (the sprite cache may drop it)
+        self._preview_seq = None  # journal seq the preview last caught up to
+        self._preview_level = 0  # zoom: each column covers PREVIEW_ZOOM_FACTOR ** level tiers
+        self._preview_segments = None  # TierSegments over the current columns, built on demand
+        self._preview_region = None
+        self._preview_block_range = None
+        self._preview_block_hits = {}  # block canvas item -> (track, level, index)
+        self.undo_history = UndoHistory()
+        self._undo_shadow = {}  # doc key -> snapshot of what the undo history last saw
+        self._undo_pending = []
+        self._undo_replaying = False
+        self.doc_cache = DocumentCache()
+        self.fragments = FragmentCache()
+        self.reward_refs = ReferenceIndex()
+        self.id_indexes = {key: IdIndex() for key in DOC_KEYS}
+        self.reward_groups = GroupIndex()
+        self._io_pool = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="bp-io")
+        self._load_generation = 0
+        self._load_futures = []
+        self._save_futures = []
+        # key -> DocumentLayout of the file as last loaded or saved, for patch saves
+        self._layouts = {}
+        # key -> (version, path, snapshot, base layout, render_document result), rendered once edits settle
+        self._prepared = {}
+        self._prepare_inflight = {}
+        self._prepare_job = None
 
         self.status_var = tk.StringVar(value="Ready.")
         self.mode_tab = tk.StringVar(value="Rewards")
@@ -458,6 +2531,9 @@ class BattlePassStudio(tk.Tk):
         self.random_reward_command_var = tk.BooleanVar(value=True)
         self.reward_group_var = tk.StringVar(value="")
         self.reward_group_filter_var = tk.StringVar(value="All")
+        self.patch_in_place_var = tk.BooleanVar(value=False)
+        self.snapshots_var = tk.BooleanVar(value=False)
+        self.undo_budget_var = tk.IntVar(value=UNDO_HISTORY_MB)
 
         self._build_ui()
         self._apply_window_constraints()
@@ -568,6 +2644,9 @@ class BattlePassStudio(tk.Tk):
         status.grid(row=1, column=0, sticky="ew")
         status.grid_columnconfigure(0, weight=1)
         ttk.Label(status, textvariable=self.status_var).grid(row=0, column=0, sticky="ew", padx=12, pady=8)
+        self.status_progress = ttk.Progressbar(status, mode="determinate", length=180)
+        self.status_progress.grid(row=0, column=1, sticky="e", padx=12, pady=8)
+        self.status_progress.grid_remove()
 
     def _build_left(self):
         self.left.grid_rowconfigure(99, weight=1)
@@ -608,6 +2687,21 @@ class BattlePassStudio(tk.Tk):
         ttk.Button(actions, text="Random Generate (Current Tab)", command=self.random_generate_current_tab).grid(
             row=1, column=0, columnspan=2, sticky="ew", padx=10, pady=(0, 10)
         )
+        ttk.Checkbutton(actions, text="Patch changed entries in place (not atomic)", variable=self.patch_in_place_var).grid(
+            row=2, column=0, columnspan=2, sticky="w", padx=10, pady=(0, 10)
+        )
+        ttk.Checkbutton(actions, text="Keep startup snapshots in user cache", variable=self.snapshots_var).grid(
+            row=3, column=0, columnspan=2, sticky="w", padx=10, pady=(0, 10)
+        )
+        ttk.Button(actions, text="Undo", command=self.undo).grid(row=4, column=0, sticky="ew", padx=(10, 6), pady=(0, 10))
+        ttk.Button(actions, text="Redo", command=self.redo).grid(row=4, column=1, sticky="ew", padx=(6, 10), pady=(0, 10))
+        ttk.Label(actions, text="Undo history (MB)").grid(row=5, column=0, sticky="w", padx=10, pady=(0, 10))
+        ttk.Spinbox(actions, from_=1, to=4096, textvariable=self.undo_budget_var, width=8).grid(
+            row=5, column=1, sticky="ew", padx=(6, 10), pady=(0, 10)
+        )
+        self.bind("<Control-z>", lambda _e: self._undo_shortcut(self.undo))
+        self.bind("<Control-y>", lambda _e: self._undo_shortcut(self.redo))
+        self.bind("<Control-Shift-Z>", lambda _e: self._undo_shortcut(self.redo))
 
         rand = ttk.Labelframe(self.left, text="Random BattlePass")
         rand.grid(row=3, column=0, sticky="ew", padx=12, pady=(0, 12))
@@ -702,12 +2796,40 @@ class BattlePassStudio(tk.Tk):
 
         self.preview_scroll = ttk.Scrollbar(lf, orient="horizontal", command=self.preview_canvas.xview)
         self.preview_scroll.grid(row=1, column=0, sticky="ew", padx=10, pady=(6, 10))
-        self.preview_canvas.configure(xscrollcommand=self.preview_scroll.set)
+        self.preview_canvas.configure(xscrollcommand=self._on_preview_xscroll)
 
         self.tooltip = Tooltip(self.preview_canvas)
-
-        self.preview_hint = ttk.Label(lf, text="Hover tiles for rewards. Free is blue, Premium is gold.", foreground=MUTED)
-        self.preview_hint.grid(row=2, column=0, sticky="w", padx=12, pady=(0, 10))
+        # one binding per event for every tile; the tile's tags say which tier it is
+        self.preview_canvas.tag_bind("tile", "<Enter>", self._on_preview_tile_enter)
+        self.preview_canvas.tag_bind("tile", "<Leave>", lambda _e: self.tooltip.hide())
+        self.preview_canvas.tag_bind("tile", "<Button-1>", self._on_preview_tile_click)
+
+        self.preview_canvas.tag_bind("block", "<Enter>", self._on_preview_block_enter)
+        self.preview_canvas.tag_bind("block", "<Leave>", lambda _e: self.tooltip.hide())
+        self.preview_canvas.tag_bind("block", "<Button-1>", self._on_preview_block_click)
+        self.preview_canvas.bind("<Control-MouseWheel>", self._on_preview_zoom_wheel)
+        self.preview_canvas.bind("<Control-Button-4>", lambda _e: self._preview_zoom(self._preview_level - 1) or "break")
+        self.preview_canvas.bind("<Control-Button-5>", lambda _e: self._preview_zoom(self._preview_level + 1) or "break")
+
+        self.preview_minimap = tk.Canvas(lf, bg=PANEL2, highlightthickness=0, bd=0, height=36)
+        self.preview_minimap.grid(row=2, column=0, sticky="ew", padx=10, pady=(0, 6))
+        self.preview_minimap.bind("<Button-1>", self._on_minimap_click)
+        self.preview_minimap.bind("<B1-Motion>", self._on_minimap_click)
+        self.preview_minimap.bind("<Configure>", lambda _e: self._draw_minimap())
+
+        zoom = ttk.Frame(lf)
+        zoom.grid(row=3, column=0, sticky="w", padx=10, pady=(0, 6))
+        ttk.Button(zoom, text="−", width=3, command=lambda: self._preview_zoom(self._preview_level + 1)).grid(row=0, column=0)
+        ttk.Button(zoom, text="+", width=3, command=lambda: self._preview_zoom(self._preview_level - 1)).grid(
+            row=0, column=1, padx=(4, 8)
+        )
+        self.preview_zoom_var = tk.StringVar(value="1 tier per column")
+        ttk.Label(zoom, textvariable=self.preview_zoom_var, foreground=MUTED).grid(row=0, column=2)
+
+        self.preview_hint = ttk.Label(
+            lf, text="Hover tiles for rewards. Free is blue, Premium is gold. Ctrl+wheel zooms.", foreground=MUTED
+        )
+        self.preview_hint.grid(row=4, column=0, sticky="w", padx=12, pady=(0, 10))
 
     # -------------------------
     # STATUS / DIRTY
@@ -715,17 +2837,350 @@ class BattlePassStudio(tk.Tk):
     def set_status(self, msg: str):
         self.status_var.set(msg)
 
+    def _show_progress(self, done: int, total: int):
+        self.status_progress.configure(maximum=max(1, total), value=done)
+        self.status_progress.grid()
+
+    def _hide_progress(self):
+        self.status_progress.grid_remove()
+
+    # -------------------------
+    # BACKGROUND WORK
+    # -------------------------
+    def _when_done(self, futures, on_done, on_progress=None):
+        # futures run on self._io_pool; poll them from the Tk thread so callbacks never touch Tk off-thread
+        pending = sum(1 for fut in futures if not fut.done())
+        if on_progress:
+            on_progress(len(futures) - pending, len(futures))
+        if pending:
+            self.after(IO_POLL_MS, self._when_done, futures, on_done, on_progress)
+            return
+        on_done()
+
+    def _schedule_preserialize(self):
+        if self._prepare_job is not None:
+            self.after_cancel(self._prepare_job)
+        self._prepare_job = self.after(PRESERIALIZE_DELAY_MS, self._preserialize)
+
+    def _preserialize(self):
+        self._prepare_job = None
+        for key in DOC_KEYS:
+            version = self.doc_versions[key]
+            if not self.dirty.get(key) or self._prepare_inflight.get(key) == version:
+                continue
+            prepared = self._prepared.get(key)
+            if prepared and prepared[0] == version:
+                continue
+            path = self._doc_path(key)
+            layout = self._layouts.get(key)
+            data = structural_copy(ensure_dict(self.state[key]))
+            fut = self._io_pool.submit(render_document, key, data, layout, self.fragments)
+            self._prepare_inflight[key] = version
+            self._when_done([fut], lambda k=key, v=version, p=path, d=data, l=layout, f=fut: self._store_prepared(k, v, p, d, l, f))
+
+    def _store_prepared(self, key, version, path, data, layout, fut):
+        if self._prepare_inflight.get(key) == version:
+            self._prepare_inflight.pop(key, None)
+        if fut.cancelled() or fut.exception() is not None:
+            return
+        current = self._prepared.get(key)
+        if current is None or current[0] < version:
+            self._prepared[key] = (version, path, data, layout, fut.result())
+
+    def destroy(self):
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
     def mark_dirty(self, key: str, dirty=True):
         self.dirty[key] = bool(dirty)
-        keys = [k for k, v in self.dirty.items() if v]
-        self.dirty_var.set("Unsaved: " + (", ".join(keys) if keys else "none"))
+        if dirty:
+            self.doc_versions[key] += 1
+            self._schedule_preserialize()
+        else:
+            self.journal.mark_saved(key)
+        self._update_dirty_label()
+
+    def _update_dirty_label(self):
+        parts = []
+        for key, dirty in self.dirty.items():
+            if not dirty:
+                continue
+            changed = self.journal.unsaved(key)
+            parts.append(f"{key} ({len(changed)})" if changed else key)
+        self.dirty_var.set("Unsaved: " + (", ".join(parts) if parts else "none"))
+
+    # Every edit reports what it touched: _entity_changed for single entities (tiers, rewards, quests, weeks),
+    # _document_changed when a whole document was replaced or rewritten. Derived indexes update from here.
+    def _entity_changed(self, key: str, eid):
+        self._adopt(key, eid)
+        index = self.id_indexes[key]
+        existed = eid in index if index.source is self._collection(key) else None
+        if eid not in self._collection(key):
+            op = "delete"
+        else:
+            op = "create" if existed is False else "update"
+        self.journal.record(key, eid, op)
+        self._update_dirty_label()
+        self._undo_record_entity(key, eid)
+        if index.source is not None:
+            coll = self._collection(key)
+            if coll is not index.source:
+                index.source = None
+            elif eid in coll:
+                index.add(eid)
+            else:
+                index.discard(eid)
+        if key == "rewards" and self.reward_groups.source is not None:
+            rewards = self._collection("rewards")
+            if rewards is not self.reward_groups.source:
+                self.reward_groups.source = None
+            elif eid in rewards:
+                self.reward_groups.set(eid, entity_column(rewards, eid, "group"))
+            else:
+                self.reward_groups.discard(eid)
+        if key in ("free", "premium"):
+            tier = ensure_dict(ensure_dict(self.state.get(key, {})).get("tiers", {})).get(str(eid))
+            self.reward_refs.set_tier(key, eid, tier_reward_ids(tier) if tier is not None else ())
+
+    def _adopt(self, key: str, eid=_MISSING):
+        # edits store plain dicts; rewards and tiers are kept as entities (see MODEL)
+        collection = ENTITY_COLLECTIONS[key]
+        cls = ENTITY_TYPES.get(collection)
+        if cls is None:
+            return
+        if eid is _MISSING:
+            adopt_entities(ensure_dict(self.state.get(key, {})), collection)
+            return
+        coll = self._collection(key)
+        value = dict.get(coll, eid)
+        if type(value) is dict:
+            dict.__setitem__(coll, eid, cls(value))
+        elif isinstance(value, Entity):
+            value._changed()  # a nested value may have been edited in place
+
+    def _document_changed(self, key: str):
+        self.journal.record(key, None, "document")
+        self._update_dirty_label()
+        self._adopt(key)
+        self._undo_record_document(key)
+        self.id_indexes[key].source = None
+        if key == "rewards":
+            self.reward_groups.source = None
+        if key in ("free", "premium"):
+            self.reward_refs.set_track(key, ensure_dict(self.state.get(key, {})).get("tiers", {}))
+
+    # -------------------------
+    # Undo / redo
+    # -------------------------
+    def _undo_snapshot(self, key: str):
+        # copies the document and its entity table, not the entities
+        doc = ensure_dict(self.state.get(key, {}))
+        ckey = ENTITY_COLLECTIONS[key]
+        if ckey == "":
+            return doc.copy()
+        snap = dict(doc)
+        if isinstance(snap.get(ckey), dict):
+            snap[ckey] = snap[ckey].copy()
+        return snap
+
+    def _undo_reset(self):
+        self.undo_history.clear()
+        self._undo_pending = []
+        self._undo_restored = {}
+        self._undo_shadow = {key: self._undo_snapshot(key) for key in DOC_KEYS}
+
+    def _undo_record_entity(self, key: str, eid):
+        snap = self._undo_shadow.get(key)
+        ckey = ENTITY_COLLECTIONS[key]
+        shadow = snap if ckey == "" or snap is None else snap.get(ckey)
+        if not isinstance(shadow, dict):
+            # the previous state was never seen, so history can only start from here
+            self._undo_reset()
+            return
+        after = dict.get(self._collection(key), eid, _MISSING)
+        before = dict.get(shadow, eid, _MISSING)
+        pos = None
+        if after is _MISSING:
+            if before is not _MISSING:
+                pos = list(shadow).index(eid)
+            dict.pop(shadow, eid, None)
+        else:
+            dict.__setitem__(shadow, eid, after)
+        if before is not after and not self._undo_replaying:
+            self._undo_add((key, eid, before, after, pos))
+
+    def _undo_record_document(self, key: str):
+        before = self._undo_shadow.get(key)
+        self._undo_shadow[key] = self._undo_snapshot(key)
+        if before is not None and not self._undo_replaying:
+            self._undo_add((key, None, before, self._undo_snapshot(key), None))
+
+    def _undo_add(self, change):
+        # everything reported before the UI goes idle again is one step
+        if not self._undo_pending:
+            self.after_idle(self._undo_close)
+        self._undo_pending.append(change)
+
+    def _undo_close(self):
+        changes, self._undo_pending = self._undo_pending, []
+        if not changes:
+            return
+        try:
+            self.undo_history.budget = max(1, int(self.undo_budget_var.get())) * 1024 * 1024
+        except (tk.TclError, ValueError):
+            pass
+        self.undo_history.push(changes, sum(undo_cost(c) for c in changes))
+
+    def _undo_apply(self, change, forward: bool):
+        key, eid, before, after, pos = change
+        value = after if forward else before
+        ckey = ENTITY_COLLECTIONS[key]
+        if eid is None:
+            doc = value.copy()
+            if ckey and isinstance(doc.get(ckey), dict):
+                doc[ckey] = doc[ckey].copy()
+            self.state[key] = doc
+            self._document_changed(key)
+        else:
+            doc = ensure_dict(self.state.get(key, {}))
+            if ckey == "":
+                coll = doc
+            else:
+                coll = doc.get(ckey)
+                if not isinstance(coll, dict):
+                    coll = doc[ckey] = {}
+            self.state[key] = doc
+            if value is _MISSING:
+                dict.pop(coll, eid, None)
+            else:
+                if type(value) is PendingEntity and not isinstance(coll, LazyEntities):
+                    value = value.parse()
+                if pos is not None and not forward and eid not in coll:
+                    # a deleted entity goes back where it was, so the saved file keeps its order
+                    insert_at(coll, min(pos, len(coll)), eid, value)
+                else:
+                    coll[eid] = value
+            self._entity_changed(key, eid)
+        if key in ("free", "premium"):
+            self._undo_restored.setdefault(key, {})[eid] = self.journal.seq
+        self.mark_dirty(key, True)
+
+    def _undo_replay(self, changes, forward: bool):
+        self._undo_replaying = True
+        try:
+            for change in changes:
+                self._undo_apply(change, forward)
+        finally:
+            self._undo_replaying = False
+        self.refresh_all_views()
+
+    def _undo_shortcut(self, action):
+        # text fields keep Ctrl+Z / Ctrl+Y for their own editing (on X11 Ctrl+Y is also <<Paste>>)
+        try:
+            focus = self.focus_get()
+        except (KeyError, tk.TclError):
+            focus = None
+        if isinstance(focus, (tk.Entry, tk.Text, tk.Spinbox)):
+            return None
+        action()
+        return "break"
+
+    def undo(self, _e=None):
+        self._undo_close()
+        changes = self.undo_history.undo()
+        if changes is None:
+            self.set_status("Nothing to undo.")
+            return
+        self._undo_replay(reversed(changes), False)
+        keys = ", ".join(sorted({c[0] for c in changes}))
+        self.set_status(f"Undid {len(changes)} change(s) to {keys}.")
+
+    def redo(self, _e=None):
+        self._undo_close()
+        changes = self.undo_history.redo()
+        if changes is None:
+            self.set_status("Nothing to redo.")
+            return
+        self._undo_replay(changes, True)
+        keys = ", ".join(sorted({c[0] for c in changes}))
+        self.set_status(f"Redid {len(changes)} change(s) to {keys}.")
+
+    # -------------------------
+    # Redraw scheduling
+    # -------------------------
+    # Refresh calls only mark a view dirty; one idle pass draws each dirty view once, however many
+    # handlers asked for it. Code that needs a view current right away (selecting a row) flushes first.
+    def _invalidate(self, *views):
+        self._dirty_views.update(views)
+        if self._redraw_job is None:
+            self._redraw_job = self.after_idle(self._flush_views)
+
+    def _flush_views(self):
+        if self._redraw_job is not None:
+            self.after_cancel(self._redraw_job)
+            self._redraw_job = None
+        draw = {
+            "rewards": self._draw_rewards_list,
+            "tiers": self._draw_tiers_list,
+            "quests": self._draw_quests_list,
+            "preview_battlepass": self._draw_preview_battlepass,
+            "preview_quests": self._draw_preview_quests,
+        }
+        for view in REDRAW_ORDER:
+            if view in self._dirty_views:
+                self._dirty_views.discard(view)
+                draw[view]()
+        if self._dirty_views:
+            # a draw invalidated a view that was already drawn; pick it up next turn
+            self._redraw_job = self.after_idle(self._flush_views)
+
+    def _refresh_rows(self, tv, context, key, ids, row):
+        # Makes tv list ids (in order) with row(id) values. If it showed the same context at its last refresh,
+        # only the shown rows of entities the journal saw change since then are re-rendered.
+        name = str(tv)
+        last = self._view_seqs.get(name)
+        self._view_seqs[name] = (self.journal.seq, context)
+        touched = None
+        if last is not None and last[1] == context:
+            touched = self.journal.touched(last[0], key)
+        tv.set_rows(ids, row, touched)
+
+    def _collection(self, key: str) -> dict:
+        ckey = ENTITY_COLLECTIONS[key]
+        doc = ensure_dict(self.state.get(key, {}))
+        return doc if ckey == "" else ensure_dict(doc.get(ckey, {}))
+
+    def _sorted_ids(self, key: str) -> list:
+        # rebuilt lazily when the collection object was swapped or an edit went unreported
+        index = self.id_indexes[key]
+        coll = self._collection(key)
+        if index.source is not coll or len(index) != len(coll):
+            index.rebuild(coll)
+        return index.ordered()
+
+    def _reward_group_index(self) -> GroupIndex:
+        rewards = self._collection("rewards")
+        if self.reward_groups.source is not rewards or len(self.reward_groups) != len(rewards):
+            self.reward_groups.rebuild(rewards)
+        return self.reward_groups
+
+    def _next_id(self, key: str) -> str:
+        self._sorted_ids(key)
+        return self.id_indexes[key].next_id()
+
+    def _doc_path(self, key: str) -> str:
+        if key == "free":
+            return self.path_free.get()
+        if key == "premium":
+            return self.path_premium.get()
+        if key == "rewards":
+            return self.path_rewards.get()
+        if key == "quests":
+            return self.state.get("quests_path") or self.path_quests.get()
+        if key == "week_pool":
+            return self.state.get("week_pool_path") or self.path_week_pool.get()
+        return ""
 
-    def _mark_tiers_dirty(self):
-        tr = self.track_var.get().strip().lower()
-        if tr not in ("free", "premium"):
-            tr = "free"
-        self.mark_dirty(tr, True)
-
     # -------------------------
     # FILE PICK
     # -------------------------
@@ -746,53 +3201,107 @@ class BattlePassStudio(tk.Tk):
     # -------------------------
     # LOAD / SAVE
     # -------------------------
-    def reload_all(self):
-        try:
-            self.state["free"] = safe_load_yaml(self.path_free.get())
-            self.state["premium"] = safe_load_yaml(self.path_premium.get())
-            self.state["rewards"] = safe_load_yaml(self.path_rewards.get())
-
-            qp = self.path_quests.get()
-            self.state["quests_path"] = qp
-            self.state["quests"] = safe_load_yaml(qp)
-
-            wp = self.path_week_pool.get()
-            self.state["week_pool_path"] = wp
-            self.state["week_pool"] = safe_load_yaml(wp)
-
-            for k in self.dirty:
-                self.mark_dirty(k, False)
-
-            self._refresh_rewards_list()
-            self._tiers_refresh_list()
-            self._quests_refresh_list()
-            self._render_preview()
-
-            self.set_status("Loaded.")
-        except Exception as e:
-            self.set_status(f"Load error: {e}")
-
     def save_all(self):
+        # Dirty documents are snapshotted here, then serialized and staged to fsynced temp files on the IO pool.
+        # Only when every file staged cleanly are they renamed over the originals, so the plugin never reads
+        # a half-written file or new rewards next to old tiers.
+        if self._save_futures:
+            self.set_status("Save already in progress.")
+            return
+        if self._load_futures:
+            # the loaded documents would replace the state being saved, and their layouts the ones it patches
+            self.set_status("Files are still loading; save once the load finishes.")
+            return
+        in_place = bool(self.patch_in_place_var.get())
         try:
-            if self.dirty.get("free"):
-                safe_dump_yaml(self.path_free.get(), ensure_dict(self.state["free"]))
-                self.mark_dirty("free", False)
-            if self.dirty.get("premium"):
-                safe_dump_yaml(self.path_premium.get(), ensure_dict(self.state["premium"]))
-                self.mark_dirty("premium", False)
-            if self.dirty.get("rewards"):
-                safe_dump_yaml(self.path_rewards.get(), ensure_dict(self.state["rewards"]))
-                self.mark_dirty("rewards", False)
-            if self.dirty.get("quests"):
-                safe_dump_yaml(self.state.get("quests_path") or self.path_quests.get(), ensure_dict(self.state["quests"]))
-                self.mark_dirty("quests", False)
-            if self.dirty.get("week_pool"):
-                safe_dump_yaml(self.state.get("week_pool_path") or self.path_week_pool.get(), ensure_dict(self.state["week_pool"]))
-                self.mark_dirty("week_pool", False)
-
-            self.set_status("Saved.")
+            jobs = []
+            rendered = []
+            for key in DOC_KEYS:
+                if not self.dirty.get(key):
+                    continue
+                path = self._doc_path(key)
+                version = self.doc_versions[key]
+                layout = self._layouts.get(key)
+                prepared = self._prepared.get(key)
+                if prepared and prepared[0] == version and prepared[1] == path and prepared[3] is layout:
+                    # rendered in the background after the last edit; only the write is left
+                    data, result = prepared[2], prepared[4]
+                else:
+                    data, result = structural_copy(ensure_dict(self.state[key])), None
+                jobs.append((key, path, data, version, layout))
+                rendered.append(result)
         except Exception as e:
             self.set_status(f"Save error: {e}")
+            return
+        if not jobs:
+            self.set_status("Nothing to save.")
+            return
+
+        self._save_futures = [
+            self._io_pool.submit(self._stage_job, key, path, data, layout, result, in_place)
+            for (key, path, data, _version, layout), result in zip(jobs, rendered)
+        ]
+
+        def progress(done, total):
+            self._show_progress(done, total + 1)
+            self.set_status(f"Saving... {done}/{total}")
+
+        self._when_done(self._save_futures, lambda: self._commit_save(jobs), progress)
+
+    def _stage_job(self, key, path, data, layout, result, in_place):
+        # worker thread: render (unless pre-rendered) and stage one document; in-place patches wait for commit
+        if result is None:
+            result = render_document(key, data, layout, self.fragments)
+        raw, _new_layout, changed = result
+        if file_holds(path, raw, layout):
+            # flagged dirty, but the edits cancelled out
+            return None, result, True
+        if in_place and changed is not None and layout.stat is not None and layout.stat == file_fingerprint(path):
+            return None, result, False
+        return stage_file(path, raw), result, False
+
+    def _commit_save(self, jobs):
+        futures = self._save_futures
+        errors = [fut.exception() for fut in futures if fut.exception() is not None]
+        staged = []
+        patches = []
+        for fut, job in zip(futures, jobs):
+            if fut.exception() is not None:
+                continue
+            tmp, (raw, _new_layout, changed), unchanged = fut.result()
+            if tmp is not None:
+                staged.append((tmp, job[1]))
+            elif not unchanged:
+                patches.append((job[1], job[4].stat, raw, changed[0], changed[1]))
+        if errors:
+            discard_staged(staged)
+            self._save_futures = []
+            self._hide_progress()
+            self.set_status(f"Save error: {errors[0]}")
+            return
+        commit = self._io_pool.submit(commit_staged, staged, patches)
+        self._when_done([commit], lambda: self._finish_save(jobs, futures, staged, commit))
+
+    def _finish_save(self, jobs, futures, staged, commit):
+        self._save_futures = []
+        self._hide_progress()
+        if commit.exception() is not None:
+            discard_staged([item for item in staged if os.path.exists(item[0])])
+            self.set_status(f"Save error: {commit.exception()}")
+            return
+        skipped = sum(1 for fut in futures if fut.result()[2])
+        for (key, path, data, version, _layout), fut in zip(jobs, futures):
+            # edits made while the save was running keep their document dirty
+            if self.doc_versions[key] == version:
+                self.mark_dirty(key, False)
+            raw, new_layout, _changed = fut.result()[1]
+            if new_layout is not None:
+                new_layout.stat = file_fingerprint(path)
+            self._layouts[key] = new_layout
+            self.doc_cache.store(path, data, raw, new_layout)
+            if self.snapshots_var.get():
+                self._io_pool.submit(write_snapshot, path, raw, data, new_layout, ENTITY_COLLECTIONS.get(key))
+        self.set_status(f"Saved ({skipped} unchanged file(s) skipped)." if skipped else "Saved.")
 
     # -------------------------
     # TAB CHANGED
@@ -944,11 +3453,9 @@ class BattlePassStudio(tk.Tk):
         self.state["quests"] = quest_root
         self.state["week_pool"] = week_pool
 
-        self.mark_dirty("rewards", True)
-        self.mark_dirty("free", True)
-        self.mark_dirty("premium", True)
-        self.mark_dirty("quests", True)
-        self.mark_dirty("week_pool", True)
+        for key in DOC_KEYS:
+            self.mark_dirty(key, True)
+            self._document_changed(key)
 
         self._reward_refresh_list()
         self._tiers_refresh_list()
@@ -977,7 +3484,7 @@ class BattlePassStudio(tk.Tk):
         self.cb_reward_group.grid(row=0, column=1, sticky="ew")
         self.cb_reward_group.bind("<<ComboboxSelected>>", lambda _e: self._refresh_rewards_list())
 
-        self.tv_rewards = ttk.Treeview(left, columns=("id", "name", "type", "group"), show="headings", height=18)
+        self.tv_rewards = VirtualTreeview(left, columns=("id", "name", "type", "group"), show="headings", height=18)
         self.tv_rewards.heading("id", text="ID")
         self.tv_rewards.heading("name", text="NAME")
         self.tv_rewards.heading("type", text="TYPE")
@@ -986,7 +3493,10 @@ class BattlePassStudio(tk.Tk):
         self.tv_rewards.column("name", width=200, stretch=True)
         self.tv_rewards.column("type", width=90, stretch=False)
         self.tv_rewards.column("group", width=110, stretch=False)
-        self.tv_rewards.grid(row=1, column=0, sticky="nsew", padx=10, pady=10)
+        self.tv_rewards.grid(row=1, column=0, sticky="nsew", padx=(10, 0), pady=10)
+        sb = ttk.Scrollbar(left, orient="vertical", command=self.tv_rewards.yview)
+        sb.grid(row=1, column=1, sticky="ns", padx=(0, 10), pady=10)
+        self.tv_rewards.attach_scrollbar(sb)
         self.tv_rewards.bind("<<TreeviewSelect>>", self._on_reward_select)
         self.tv_rewards.bind("<ButtonPress-1>", self._on_rewards_drag_start)
         self.tv_rewards.bind("<ButtonRelease-1>", self._on_rewards_drag_drop)
@@ -1088,10 +3598,11 @@ class BattlePassStudio(tk.Tk):
     def _rewards_dict(self):
         return ensure_dict(self.state.get("rewards", {}))
 
+    def _reward_list_dict(self):
+        return self._rewards_dict()
+
     def _refresh_reward_group_filter(self, rewards=None):
-        rewards = rewards if rewards is not None else self._rewards_dict()
-        groups = sorted({str(ensure_dict(r).get("group", "")).strip() for r in rewards.values() if str(ensure_dict(r).get("group", "")).strip()})
-        values = ["All"] + groups
+        values = ["All"] + self._reward_group_index().groups()
         if hasattr(self, "cb_reward_group"):
             self.cb_reward_group["values"] = values
         current = (self.reward_group_filter_var.get() or "All").strip()
@@ -1099,22 +3610,7 @@ class BattlePassStudio(tk.Tk):
             self.reward_group_filter_var.set("All")
 
     def _refresh_rewards_list(self):
-        self.tv_rewards.delete(*self.tv_rewards.get_children())
-        rewards = self._rewards_dict()
-        self._refresh_reward_group_filter(rewards)
-        filter_group = (self.reward_group_filter_var.get() or "All").strip()
-        keys = sorted(rewards.keys(), key=numeric_sort_key)
-        for rid in keys:
-            r = ensure_dict(rewards.get(rid, {}))
-            group = str(r.get("group", "")).strip()
-            if filter_group != "All" and group != filter_group:
-                continue
-            self.tv_rewards.insert(
-                "",
-                "end",
-                iid=str(rid),
-                values=(str(rid), str(r.get("name", "")), str(r.get("type", "")), group),
-            )
+        self._reward_refresh_list()
 
     def _on_reward_select(self, _e=None):
         rid = self._tv_selected(self.tv_rewards)
@@ -1166,7 +3662,7 @@ class BattlePassStudio(tk.Tk):
 
     def _reward_add(self):
         rewards = self._rewards_dict()
-        rid = next_numeric_string_id(rewards.keys())
+        rid = self._next_id("rewards")
         rewards[rid] = {
             "name": "New Reward",
             "type": "item",
@@ -1174,6 +3670,7 @@ class BattlePassStudio(tk.Tk):
         }
         self.state["rewards"] = rewards
         self.mark_dirty("rewards", True)
+        self._entity_changed("rewards", rid)
         self._refresh_rewards_list()
         self._select_iid(self.tv_rewards, rid)
         self.set_status(f"Added reward {rid}.")
@@ -1186,11 +3683,12 @@ class BattlePassStudio(tk.Tk):
             return
         rewards = self._rewards_dict()
         src = ensure_dict(rewards.get(str(rid), {}))
-        new_id = next_numeric_string_id(rewards.keys())
-        rewards[new_id] = deep_copy(src)
+        new_id = self._next_id("rewards")
+        rewards[new_id] = cow_copy(src)
         rewards[new_id]["name"] = str(rewards[new_id].get("name", "Reward")) + " (Copy)"
         self.state["rewards"] = rewards
         self.mark_dirty("rewards", True)
+        self._entity_changed("rewards", new_id)
         self._refresh_rewards_list()
         self._select_iid(self.tv_rewards, new_id)
         self.set_status(f"Duplicated reward {rid} -> {new_id}.")
@@ -1213,7 +3711,8 @@ class BattlePassStudio(tk.Tk):
         rid = str(rid)
 
         if hasattr(self, "_reward_is_referenced") and self._reward_is_referenced(rid):
-            self.set_status(f"Cannot delete reward {rid}: referenced by a tier.")
+            used = ", ".join(f"{track} tier {tid}" for track, tid in self._reward_used_by(rid)[:5])
+            self.set_status(f"Cannot delete reward {rid}: referenced by {used}.")
             return
 
         # Get rewards dict (support both naming styles)
@@ -1229,6 +3728,7 @@ class BattlePassStudio(tk.Tk):
 
         if hasattr(self, "mark_dirty"):
             self.mark_dirty("rewards", True)
+            self._entity_changed("rewards", rid)
 
         # Refresh list UI (support both naming styles)
         if hasattr(self, "_reward_refresh_list"):
@@ -1259,7 +3759,7 @@ class BattlePassStudio(tk.Tk):
 
         # Choose a new numeric ID
         if "next_numeric_string_id" in globals():
-            new_id = next_numeric_string_id(rewards.keys())
+            new_id = self._next_id("rewards")
         else:
             # Fallback if helper is missing
             used = set()
@@ -1288,6 +3788,7 @@ class BattlePassStudio(tk.Tk):
 
         if hasattr(self, "mark_dirty"):
             self.mark_dirty("rewards", True)
+            self._entity_changed("rewards", new_id)
 
         # Refresh list UI (support both naming styles)
         if hasattr(self, "_reward_refresh_list"):
@@ -1296,11 +3797,7 @@ class BattlePassStudio(tk.Tk):
             self._refresh_rewards_list()
 
         # Select new row
-        try:
-            self.tv_rewards.selection_set(new_id)
-            self.tv_rewards.see(new_id)
-        except Exception:
-            pass
+        self._select_iid(self.tv_rewards, new_id)
 
         self.set_status(f"Random-generated reward {new_id}.")
 
@@ -1318,7 +3815,7 @@ class BattlePassStudio(tk.Tk):
         rewards = self._reward_list_dict()
         if rid not in rewards:
             rewards[rid] = {}
-        r = ensure_dict(rewards.get(rid, {}))
+        r = dict(ensure_dict(rewards.get(rid, {})))
 
         r["name"] = self.reward_name_var.get().strip() or "Reward"
         r["type"] = self.reward_type_var.get().strip().lower() or "item"
@@ -1372,7 +3869,7 @@ class BattlePassStudio(tk.Tk):
             if bool(self.item_glow_var.get()):
                 it["glow"] = True
 
-            items = ensure_dict(r.get("items", {}))
+            items = dict(ensure_dict(r.get("items", {})))
             items["1"] = it
             r["items"] = items
 
@@ -1382,13 +3879,10 @@ class BattlePassStudio(tk.Tk):
         rewards[rid] = r
         self.state["rewards"] = rewards
         self.mark_dirty("rewards", True)
+        self._entity_changed("rewards", rid)
 
         self._reward_refresh_list()
-        try:
-            self.tv_rewards.selection_set(rid)
-            self.tv_rewards.see(rid)
-        except Exception:
-            pass
+        self._select_iid(self.tv_rewards, rid)
 
         self.set_status(f"Applied changes to reward {rid}.")
         self.refresh_all_views()
@@ -1435,13 +3929,10 @@ class BattlePassStudio(tk.Tk):
         rewards[rid] = parsed
         self.state["rewards"] = rewards
         self.mark_dirty("rewards", True)
+        self._entity_changed("rewards", rid)
 
         self._reward_refresh_list()
-        try:
-            self.tv_rewards.selection_set(rid)
-            self.tv_rewards.see(rid)
-        except Exception:
-            pass
+        self._select_iid(self.tv_rewards, rid)
 
         self._reward_load_into_editor(rid, ensure_dict(parsed))
         self.set_status(f"Applied YAML to reward {rid}.")
@@ -1465,14 +3956,17 @@ class BattlePassStudio(tk.Tk):
         cb.bind("<<ComboboxSelected>>", lambda _e: self._tiers_refresh_list())
 
         cols = ("tier", "required", "rewards")
-        self.tv_tiers = ttk.Treeview(left, columns=cols, show="headings", height=18)
+        self.tv_tiers = VirtualTreeview(left, columns=cols, show="headings", height=18)
         self.tv_tiers.heading("tier", text="TIER")
         self.tv_tiers.heading("required", text="REQ POINTS")
         self.tv_tiers.heading("rewards", text="REWARDS")
         self.tv_tiers.column("tier", width=70, stretch=False)
         self.tv_tiers.column("required", width=110, stretch=False)
         self.tv_tiers.column("rewards", width=260, stretch=True)
-        self.tv_tiers.grid(row=1, column=0, sticky="nsew", padx=8, pady=(0, 8))
+        self.tv_tiers.grid(row=1, column=0, sticky="nsew", padx=(8, 0), pady=(0, 8))
+        sb = ttk.Scrollbar(left, orient="vertical", command=self.tv_tiers.yview)
+        sb.grid(row=1, column=1, sticky="ns", padx=(0, 8), pady=(0, 8))
+        self.tv_tiers.attach_scrollbar(sb)
         self.tv_tiers.bind("<<TreeviewSelect>>", self._on_tier_select)
         self.tv_tiers.bind("<ButtonPress-1>", self._on_tiers_drag_start)
         self.tv_tiers.bind("<ButtonRelease-1>", self._on_tiers_drag_drop)
@@ -1561,11 +4055,14 @@ class BattlePassStudio(tk.Tk):
         left.grid_columnconfigure(0, weight=1)
 
         cols = ("id", "name", "type", "points")
-        self.tv_quests = ttk.Treeview(left, columns=cols, show="headings", height=18)
+        self.tv_quests = VirtualTreeview(left, columns=cols, show="headings", height=18)
         for c, w in [("id", 70), ("name", 250), ("type", 120), ("points", 80)]:
             self.tv_quests.heading(c, text=c.upper())
             self.tv_quests.column(c, width=w, stretch=True)
-        self.tv_quests.grid(row=0, column=0, sticky="nsew", padx=8, pady=8)
+        self.tv_quests.grid(row=0, column=0, sticky="nsew", padx=(8, 0), pady=8)
+        sb = ttk.Scrollbar(left, orient="vertical", command=self.tv_quests.yview)
+        sb.grid(row=0, column=1, sticky="ns", padx=(0, 8), pady=8)
+        self.tv_quests.attach_scrollbar(sb)
         self.tv_quests.bind("<<TreeviewSelect>>", self._on_quest_select)
 
         btnrow = ttk.Frame(left)
@@ -1728,14 +4225,26 @@ class BattlePassStudio(tk.Tk):
         pd = ensure_dict(self.state.get(tr, {}))
         tiers = ensure_dict(pd.get("tiers", {}))
         limit = self._tier_reward_limit(tr)
+        # only tiers edited since the last check can be over the limit
+        last = self._limits_seq.get(tr)
+        touched = None if last is None else self.journal.touched(last, tr)
+        check = list(tiers) if touched is None else [tid for tid in touched if tid in tiers]
+        # tiers put back by undo / redo are taken as they were, unless edited again since
+        restored = self._undo_restored.pop(tr, {})
+        if restored:
+            whole = restored.get(None)
+            check = [tid for tid in check if self.journal.version(tr, tid) not in (whole, restored.get(tid))]
         trimmed_any = False
-        for tid, tier in tiers.items():
-            t = ensure_dict(tier)
+        for tid in check:
+            t = ensure_dict(tiers[tid])
             rewards = [str(x) for x in ensure_list(t.get("rewards", []))]
             if len(rewards) > limit:
+                t = dict(t)
                 t["rewards"] = rewards[:limit]
                 tiers[tid] = t
+                self._entity_changed(tr, tid)
                 trimmed_any = True
+        self._limits_seq[tr] = self.journal.seq
         if trimmed_any:
             pd["tiers"] = tiers
             self.state[tr] = pd
@@ -1761,21 +4270,24 @@ class BattlePassStudio(tk.Tk):
         return (w.get("1.0", "end") or "").rstrip("\n")
 
     def _reward_refresh_list(self):
-        self.tv_rewards.delete(*self.tv_rewards.get_children())
+        self._invalidate("rewards")
+
+    def _draw_rewards_list(self):
         rewards = ensure_dict(self.state.get("rewards", {}))
         self._refresh_reward_group_filter(rewards)
         filter_group = (self.reward_group_filter_var.get() or "All").strip()
-        for rid in sorted(rewards.keys(), key=numeric_sort_key):
-            r = ensure_dict(rewards.get(rid, {}))
-            group = str(r.get("group", "")).strip()
-            if filter_group != "All" and group != filter_group:
-                continue
-            self.tv_rewards.insert(
-                "",
-                "end",
-                iid=str(rid),
-                values=(str(rid), str(r.get("name", "")), str(r.get("type", "")), group),
-            )
+        if filter_group == "All":
+            ids = self._sorted_ids("rewards")
+        else:
+            ids = self._reward_group_index().ordered(filter_group)
+
+        def row(rid):
+            group = str(entity_column(rewards, rid, "group")).strip()
+            name = entity_column(rewards, rid, "name")
+            kind = entity_column(rewards, rid, "type")
+            return (str(rid), str(name), str(kind), group)
+
+        self._refresh_rows(self.tv_rewards, ("rewards", filter_group), "rewards", ids, row)
 
     def _on_rewards_drag_start(self, event):
         if (self.reward_group_filter_var.get() or "All").strip() != "All":
@@ -1810,24 +4322,32 @@ class BattlePassStudio(tk.Tk):
             return
         rewards = ensure_dict(self.state.get("rewards", {}))
         mapping = {}
-        new_rewards = {}
+        # unopened entities move across as their pending spans, so a large rewards file stays lazy
+        new_rewards = LazyEntities() if isinstance(rewards, LazyEntities) else {}
         for new_idx, old_id in enumerate(order, start=1):
             new_id = str(new_idx)
             mapping[str(old_id)] = new_id
-            new_rewards[new_id] = ensure_dict(rewards.get(str(old_id), {}))
-        for track in ("free", "premium"):
+            value = dict.get(rewards, str(old_id), {})
+            new_rewards[new_id] = value if type(value) is PendingEntity else ensure_dict(value)
+        # only tiers that reference a renumbered reward need rewriting
+        touched = set()
+        for old_id, new_id in mapping.items():
+            if old_id != new_id:
+                touched |= self.reward_refs.users(old_id)
+        for track, tid in sorted(touched):
             track_data = ensure_dict(self.state.get(track, {}))
             tiers = ensure_dict(track_data.get("tiers", {}))
-            for tid, tier in tiers.items():
-                t = ensure_dict(tier)
-                t["rewards"] = [mapping.get(str(r), str(r)) for r in ensure_list(t.get("rewards", []))]
-                tiers[tid] = t
+            t = dict(ensure_dict(tiers.get(tid, {})))
+            t["rewards"] = [mapping.get(str(r), str(r)) for r in ensure_list(t.get("rewards", []))]
+            tiers[tid] = t
             track_data["tiers"] = tiers
             self.state[track] = track_data
+            self._entity_changed(track, tid)
         self.state["rewards"] = new_rewards
         self.mark_dirty("rewards", True)
-        self.mark_dirty("free", True)
-        self.mark_dirty("premium", True)
+        self._document_changed("rewards")
+        for track in sorted({track for track, _tid in touched}):
+            self.mark_dirty(track, True)
         self._reward_refresh_list()
         self._tiers_refresh_list()
         self._render_preview_battlepass()
@@ -1846,20 +4366,25 @@ class BattlePassStudio(tk.Tk):
         return ensure_dict(pd.get("tiers", {}))
 
     def _tiers_refresh_list(self):
+        self._invalidate("tiers")
+
+    def _draw_tiers_list(self):
         if not hasattr(self, "tv_tiers"):
             return
         tr = self.track_var.get().strip().lower()
         if tr not in ("free", "premium"):
             tr = "free"
         self._enforce_tier_reward_limits(tr)
-        self.tv_tiers.delete(*self.tv_tiers.get_children())
         tiers = self._tiers_dict()
-        for tid in sorted(tiers.keys(), key=numeric_sort_key):
+
+        def row(tid):
             t = ensure_dict(tiers.get(tid, {}))
             req = t.get("required-points", t.get("required_points", 0))
             rewards = ensure_list(t.get("rewards", []))
             rtxt = ", ".join([str(x) for x in rewards])
-            self.tv_tiers.insert("", "end", iid=str(tid), values=(str(tid), str(req), rtxt))
+            return (str(tid), str(req), rtxt)
+
+        self._refresh_rows(self.tv_tiers, (tr,), tr, self._sorted_ids(tr), row)
 
     def _on_tiers_drag_start(self, event):
         if not hasattr(self, "tv_tiers"):
@@ -1901,6 +4426,7 @@ class BattlePassStudio(tk.Tk):
         track_data["tiers"] = new_tiers
         self.state[tr] = track_data
         self.mark_dirty(tr, True)
+        self._document_changed(tr)
         self._tiers_refresh_list()
         selected_new = mapping.get(str(self.tier_original_id)) or mapping.get(str(self._tv_selected_iid(self.tv_tiers)))
         if selected_new:
@@ -1928,6 +4454,7 @@ class BattlePassStudio(tk.Tk):
         self._set_text(self.txt_tier_yaml, yaml.safe_dump(t, sort_keys=False))
 
     def _tiers_select(self, tid: str):
+        self._flush_views()
         try:
             self.tv_tiers.selection_set(tid)
             self.tv_tiers.see(tid)
@@ -1939,11 +4466,12 @@ class BattlePassStudio(tk.Tk):
         tr = self.track_var.get().strip().lower()
         pd = ensure_dict(self.state.get(tr, {}))
         tiers = ensure_dict(pd.get("tiers", {}))
-        new_id = next_numeric_string_id(tiers.keys())
+        new_id = self._next_id(tr)
         tiers[new_id] = {"required-points": 0, "rewards": []}
         pd["tiers"] = tiers
         self.state[tr] = pd
         self.mark_dirty(tr, True)
+        self._entity_changed(tr, new_id)
         self._tiers_refresh_list()
         self._tiers_select(new_id)
         self.set_status(f"Added tier {new_id} to {tr}.")
@@ -1958,11 +4486,12 @@ class BattlePassStudio(tk.Tk):
         pd = ensure_dict(self.state.get(tr, {}))
         tiers = ensure_dict(pd.get("tiers", {}))
         src = ensure_dict(tiers.get(str(tid), {}))
-        new_id = next_numeric_string_id(tiers.keys())
-        tiers[new_id] = deep_copy(src)
+        new_id = self._next_id(tr)
+        tiers[new_id] = cow_copy(src)
         pd["tiers"] = tiers
         self.state[tr] = pd
         self.mark_dirty(tr, True)
+        self._entity_changed(tr, new_id)
         self._tiers_refresh_list()
         self._tiers_select(new_id)
         self.set_status(f"Duplicated tier {tid} -> {new_id} in {tr}.")
@@ -1980,6 +4509,7 @@ class BattlePassStudio(tk.Tk):
         pd["tiers"] = tiers
         self.state[tr] = pd
         self.mark_dirty(tr, True)
+        self._entity_changed(tr, tid)
         self._tiers_refresh_list()
         self._tier_clear_editor()
         self.set_status(f"Deleted tier {tid} from {tr}.")
@@ -2010,7 +4540,7 @@ class BattlePassStudio(tk.Tk):
         if tid != original_tid and tid in tiers:
             self.set_status(f"Tier ID {tid} already exists in {tr}.")
             return
-        t = ensure_dict(tiers.get(original_tid, tiers.get(tid, {})))
+        t = dict(ensure_dict(tiers.get(original_tid, tiers.get(tid, {}))))
 
         try:
             req = int(self.tier_required_var.get().strip() or "0")
@@ -2038,6 +4568,8 @@ class BattlePassStudio(tk.Tk):
         self.state[tr] = pd
 
         self.mark_dirty(tr, True)
+        self._entity_changed(tr, original_tid)
+        self._entity_changed(tr, tid)
         self._tiers_refresh_list()
         self._tiers_select(tid)
         self.tier_original_id = tid
@@ -2087,6 +4619,8 @@ class BattlePassStudio(tk.Tk):
         pd["tiers"] = tiers
         self.state[tr] = pd
         self.mark_dirty(tr, True)
+        self._entity_changed(tr, original_tid)
+        self._entity_changed(tr, tid)
         self._tiers_refresh_list()
         self._tiers_select(tid)
         self.tier_original_id = tid
@@ -2118,10 +4652,11 @@ class BattlePassStudio(tk.Tk):
             return
 
         rewards = ensure_dict(self.state.get("rewards", {}))
-        new_rid = next_numeric_string_id(rewards.keys())
+        new_rid = self._next_id("rewards")
         rewards[new_rid] = gen_random_reward()
         self.state["rewards"] = rewards
         self.mark_dirty("rewards", True)
+        self._entity_changed("rewards", new_rid)
         self._reward_refresh_list()
 
         self.tier_add_reward_id_var.set(new_rid)
@@ -2175,19 +4710,21 @@ class BattlePassStudio(tk.Tk):
             pd["tiers"] = tiers
             self.state[tr] = pd
             self.mark_dirty(tr, True)
+            self._document_changed(tr)
             self._tiers_refresh_list()
             self._render_preview_battlepass()
             self.set_status("Cleared tier rewards (no rewards available).")
             return
         limit = self._tier_reward_limit(tr)
         for tid in tiers:
-            t = ensure_dict(tiers.get(tid, {}))
+            t = dict(ensure_dict(tiers.get(tid, {})))
             count = 1 if limit == 1 else random.randint(1, limit)
             t["rewards"] = random.sample(reward_ids, min(count, len(reward_ids)))
             tiers[tid] = t
         pd["tiers"] = tiers
         self.state[tr] = pd
         self.mark_dirty(tr, True)
+        self._document_changed(tr)
         self._tiers_refresh_list()
         self._render_preview_battlepass()
         self.set_status(f"Randomized rewards for all {tr} tiers.")
@@ -2200,6 +4737,7 @@ class BattlePassStudio(tk.Tk):
         pd["tiers"] = {}
         self.state[tr] = pd
         self.mark_dirty(tr, True)
+        self._document_changed(tr)
         self._tiers_refresh_list()
         self._tier_clear_editor()
         self._render_preview_battlepass()
@@ -2219,15 +4757,19 @@ class BattlePassStudio(tk.Tk):
             root["quests"] = {}
         return root
 
-    def _quests_refresh_list(self):
+    def _draw_quests_list(self):
         if not hasattr(self, "tv_quests"):
             return
-        self.tv_quests.delete(*self.tv_quests.get_children())
         qd = self._quests_dict()
-        for qid in sorted(qd.keys(), key=numeric_sort_key):
+
+        def row(qid):
             q = ensure_dict(qd.get(qid, {}))
-            self.tv_quests.insert("", "end", iid=str(qid), values=(str(qid), str(q.get("name", "")), str(q.get("type", "")), str(q.get("points", ""))))
-        self._render_preview_quests()
+            return (str(qid), str(q.get("name", "")), str(q.get("type", "")), str(q.get("points", "")))
+
+        self._refresh_rows(self.tv_quests, ("quests",), "quests", self._sorted_ids("quests"), row)
+
+    def _quests_refresh_list(self):
+        self._invalidate("quests", "preview_quests")
 
     def _on_quest_select(self, _e=None):
         qid = self._tv_selected_iid(self.tv_quests)
@@ -2258,14 +4800,14 @@ class BattlePassStudio(tk.Tk):
     def _quest_add(self):
         root = self._quests_root()
         qd = ensure_dict(root.get("quests", {}))
-        new_id = next_numeric_string_id(qd.keys())
+        new_id = self._next_id("quests")
         qd[new_id] = gen_random_quest()
         root["quests"] = qd
         self.state["quests"] = root
         self.mark_dirty("quests", True)
+        self._entity_changed("quests", new_id)
         self._quests_refresh_list()
-        self.tv_quests.selection_set(new_id)
-        self.tv_quests.see(new_id)
+        self._select_iid(self.tv_quests, new_id)
         self.set_status(f"Added quest {new_id}.")
 
     def _quest_duplicate(self):
@@ -2276,15 +4818,15 @@ class BattlePassStudio(tk.Tk):
         root = self._quests_root()
         qd = ensure_dict(root.get("quests", {}))
         src = ensure_dict(qd.get(str(qid), {}))
-        new_id = next_numeric_string_id(qd.keys())
-        qd[new_id] = deep_copy(src)
+        new_id = self._next_id("quests")
+        qd[new_id] = cow_copy(src)
         qd[new_id]["name"] = str(qd[new_id].get("name", "Quest")) + " (Copy)"
         root["quests"] = qd
         self.state["quests"] = root
         self.mark_dirty("quests", True)
+        self._entity_changed("quests", new_id)
         self._quests_refresh_list()
-        self.tv_quests.selection_set(new_id)
-        self.tv_quests.see(new_id)
+        self._select_iid(self.tv_quests, new_id)
         self.set_status(f"Duplicated quest {qid} -> {new_id}.")
 
     def _quest_delete(self):
@@ -2298,6 +4840,7 @@ class BattlePassStudio(tk.Tk):
         root["quests"] = qd
         self.state["quests"] = root
         self.mark_dirty("quests", True)
+        self._entity_changed("quests", str(qid))
         self._quests_refresh_list()
         self._quest_clear_editor()
         self.set_status(f"Deleted quest {qid}.")
@@ -2313,7 +4856,7 @@ class BattlePassStudio(tk.Tk):
 
         root = self._quests_root()
         qd = ensure_dict(root.get("quests", {}))
-        q = ensure_dict(qd.get(qid, {}))
+        q = dict(ensure_dict(qd.get(qid, {})))
 
         q["name"] = self.quest_name_var.get().strip()
         q["type"] = self.quest_type_var.get().strip()
@@ -2341,7 +4884,7 @@ class BattlePassStudio(tk.Tk):
         else:
             q.pop("special-progress", None)
 
-        item = ensure_dict(q.get("item", {}))
+        item = dict(ensure_dict(q.get("item", {})))
         item["material"] = self.quest_item_mat_var.get().strip()
         try:
             item["amount"] = int(self.quest_item_amt_var.get().strip() or "1")
@@ -2359,8 +4902,9 @@ class BattlePassStudio(tk.Tk):
         root["quests"] = qd
         self.state["quests"] = root
         self.mark_dirty("quests", True)
+        self._entity_changed("quests", qid)
         self._quests_refresh_list()
-        self.tv_quests.selection_set(qid)
+        self._select_iid(self.tv_quests, qid)
         self.set_status(f"Applied changes to quest {qid}.")
         self._render_preview_quests()
 
@@ -2387,8 +4931,9 @@ class BattlePassStudio(tk.Tk):
         root["quests"] = qd
         self.state["quests"] = root
         self.mark_dirty("quests", True)
+        self._entity_changed("quests", qid)
         self._quests_refresh_list()
-        self.tv_quests.selection_set(qid)
+        self._select_iid(self.tv_quests, qid)
         self.set_status(f"Applied YAML to quest {qid}.")
         self._render_preview_quests()
 
@@ -2420,84 +4965,396 @@ class BattlePassStudio(tk.Tk):
     # Preview Renderers
     # -------------------------
     def _render_preview_battlepass(self):
+        self._invalidate("preview_battlepass")
+
+    def _draw_preview_battlepass(self):
         if not hasattr(self, "preview_canvas"):
             return
 
         self._enforce_tier_reward_limits("free")
         self._enforce_tier_reward_limits("premium")
 
+        # what changed since the last draw; None when only a full redraw is safe
+        since, self._preview_seq = self._preview_seq, self.journal.seq
+        changed = {}
+        for key in ("free", "premium", "rewards"):
+            touched = None if since is None else self.journal.touched(since, key)
+            if touched is None:
+                changed = None
+                break
+            changed[key] = touched
+
+        ordered = heapq.merge(self._sorted_ids("free"), self._sorted_ids("premium"), key=numeric_sort_key)
+        ids = list(dict.fromkeys(str(k) for k in ordered))
+        dirty = set()
+        if changed is not None:
+            for track in ("free", "premium"):
+                dirty.update((track, str(tid)) for tid in changed[track])
+            for rid in changed["rewards"]:
+                dirty |= {(track, str(tid)) for track, tid in self.reward_refs.users(rid)}
+        if changed is None:
+            self._preview_segments = None
+        elif self._preview_segments is not None:
+            pos = {tid: col for col, tid in enumerate(ids)}
+            if ids != self._preview_ids and not self._preview_splice(ids, pos):
+                self._preview_segments = None
+            else:
+                for track, tid in dirty:
+                    if tid in pos:
+                        self._preview_segments.update(track, pos[tid], self._preview_leaf(track, tid))
+
+        if changed is None:
+            self._preview_redraw(ids)
+        elif self._preview_level > 0:
+            self._preview_ids = ids
+            self._preview_pos = {tid: col for col, tid in enumerate(ids)}
+            self._preview_draw_blocks(force=True)
+        else:
+            if ids != self._preview_ids:
+                self._preview_set_columns(ids)
+            for track, tid in dirty:
+                if tid in self._preview_drawn:
+                    self._preview_draw_tile(track, tid)
+            self._preview_cull()
+        self._draw_minimap()
+
+    def _preview_redraw(self, ids):
         c = self.preview_canvas
         c.delete("all")
-
-        rewards = ensure_dict(self.state.get("rewards", {}))
-        free_tiers = ensure_dict(ensure_dict(self.state.get("free", {})).get("tiers", {}))
-        prem_tiers = ensure_dict(ensure_dict(self.state.get("premium", {})).get("tiers", {}))
-
-        all_ids = sorted(set([str(k) for k in free_tiers.keys()] + [str(k) for k in prem_tiers.keys()]), key=numeric_sort_key)
-
-        pad_x = 16
-        x = pad_x
-        tile = 56
-        gap = 14
-        y_p = 40
-        y_f = 120
-
-        c.create_text(pad_x, 16, text="PREMIUM", anchor="w", fill=PREM_COL, font=FONT_B)
-        c.create_text(pad_x, 96, text="FREE", anchor="w", fill=FREE_COL, font=FONT_B)
-
-        for tid in all_ids:
-            p_exists = tid in prem_tiers
-            f_exists = tid in free_tiers
-            p = ensure_dict(prem_tiers.get(tid, {}))
-            f = ensure_dict(free_tiers.get(tid, {}))
-
-            pid_list = [str(v) for v in ensure_list(p.get("rewards", []))]
-            fid_list = [str(v) for v in ensure_list(f.get("rewards", []))]
-
-            p_em = "".join([reward_emoji(ensure_dict(rewards.get(rid, {}))) for rid in pid_list]) or "—"
-            f_em = "".join([reward_emoji(ensure_dict(rewards.get(rid, {}))) for rid in fid_list]) or "—"
-
-            def _format_reward_name(rid):
-                rr = ensure_dict(rewards.get(rid, {}))
-                emoji = reward_emoji(rr)
-                name = str(rr.get("name", f"Reward {rid}"))
-                return f"{emoji} {name}"
-
-            tier_drawn = False
-            if p_exists:
-                pr = c.create_rectangle(x, y_p, x + tile, y_p + tile, fill=PREM_COL, outline="")
-                pt = c.create_text(x + tile / 2, y_p + tile / 2, text=p_em, font=("Segoe UI", 16))
-                p_names = [_format_reward_name(rid) for rid in pid_list]
-                p_tip = f"Tier {tid}\nPremium\n\n" + ("\n".join(p_names) if p_names else "No rewards")
-                for item in (pr, pt):
-                    c.tag_bind(item, "<Enter>", lambda e, t=p_tip: self.tooltip.show(t, e.x_root, e.y_root))
-                    c.tag_bind(item, "<Leave>", lambda _e: self.tooltip.hide())
-                    c.tag_bind(item, "<Button-1>", lambda _e, tr="premium", tid=tid: self._select_tier_from_preview(tr, tid))
-                tier_drawn = True
-
-            if f_exists:
-                fr = c.create_rectangle(x, y_f, x + tile, y_f + tile, fill=FREE_COL, outline="")
-                ft = c.create_text(x + tile / 2, y_f + tile / 2, text=f_em, font=("Segoe UI", 16))
-                f_names = [_format_reward_name(rid) for rid in fid_list]
-                f_tip = f"Tier {tid}\nFree\n\n" + ("\n".join(f_names) if f_names else "No rewards")
-                for item in (fr, ft):
-                    c.tag_bind(item, "<Enter>", lambda e, t=f_tip: self.tooltip.show(t, e.x_root, e.y_root))
-                    c.tag_bind(item, "<Leave>", lambda _e: self.tooltip.hide())
-                    c.tag_bind(item, "<Button-1>", lambda _e, tr="free", tid=tid: self._select_tier_from_preview(tr, tid))
-                tier_drawn = True
-
-            if tier_drawn:
-                c.create_text(x + tile / 2, y_f + tile + 16, text=str(tid), fill=MUTED, font=FONT)
-                x += tile + gap
-
-        c.configure(scrollregion=c.bbox("all"))
+        self._preview_drawn = set()
+        self._preview_tiles = {}
+        self._preview_labels = {}
+        self._preview_hits = {}
+        self._preview_images = {}
+        c.create_text(PREVIEW_PAD_X, 16, text="PREMIUM", anchor="w", fill=PREM_COL, font=FONT_B)
+        c.create_text(PREVIEW_PAD_X, 96, text="FREE", anchor="w", fill=FREE_COL, font=FONT_B)
+        if self._preview_level > 0:
+            self._preview_ids = ids
+            self._preview_pos = {tid: col for col, tid in enumerate(ids)}
+            self._preview_draw_blocks(force=True)
+            return
+        self._preview_set_columns(ids)
+        self._preview_cull()
+
+    def _preview_set_columns(self, ids):
+        # Drawn columns whose tier moved slide to the new position; removed tiers disappear.
+        c = self.preview_canvas
+        pos = {tid: col for col, tid in enumerate(ids)}
+        step = PREVIEW_TILE + PREVIEW_GAP
+        for tid in list(self._preview_drawn):
+            new, old = pos.get(tid), self._preview_pos.get(tid)
+            if new is None:
+                self._preview_drop_column(tid)
+            elif new != old:
+                for item in self._preview_column_items(tid):
+                    c.move(item, (new - old) * step, 0)
+        self._preview_ids = ids
+        self._preview_pos = pos
+        self._preview_set_region(len(ids))
+
+    def _preview_set_region(self, columns: int):
+        # an unchanged scrollregion is not set again: that would re-fire xscrollcommand and redraw
+        width = max(PREVIEW_PAD_X + columns * (PREVIEW_TILE + PREVIEW_GAP), PREVIEW_PAD_X + 80)
+        region = (0, 0, width, PREVIEW_Y_FREE + PREVIEW_TILE + 32)
+        if region != self._preview_region:
+            self._preview_region = region
+            self.preview_canvas.configure(scrollregion=region)
+
+    def _preview_visible_columns(self, columns: int) -> range:
+        c = self.preview_canvas
+        step = PREVIEW_TILE + PREVIEW_GAP
+        left = c.canvasx(0) - PREVIEW_PAD_X
+        right = c.canvasx(max(1, c.winfo_width())) - PREVIEW_PAD_X
+        first = max(0, int(left // step) - PREVIEW_OVERSCAN)
+        return range(first, max(first, min(columns, int(right // step) + 1 + PREVIEW_OVERSCAN)))
+
+    def _preview_cull(self):
+        # Draws the tier columns that intersect the view (plus overscan) and drops the ones that left it.
+        cols = self._preview_visible_columns(len(self._preview_ids))
+        wanted = set(self._preview_ids[cols.start:cols.stop])
+        for tid in self._preview_drawn - wanted:
+            self._preview_drop_column(tid)
+        for tid in wanted - self._preview_drawn:
+            self._preview_draw_column(tid)
+        self._preview_drawn = wanted
+
+    def _preview_column_items(self, tid: str):
+        items = [item for track, _y, _fill in PREVIEW_ROWS for item in self._preview_tiles.get((track, tid), ())]
+        if tid in self._preview_labels:
+            items.append(self._preview_labels[tid])
+        return items
+
+    def _preview_drop_column(self, tid: str):
+        c = self.preview_canvas
+        for item in self._preview_column_items(tid):
+            c.delete(item)
+            self._preview_hits.pop(item, None)
+            self._preview_images.pop(item, None)
+        for track, _y, _fill in PREVIEW_ROWS:
+            self._preview_tiles.pop((track, tid), None)
+        self._preview_labels.pop(tid, None)
+        self._preview_drawn.discard(tid)
+
+    def _preview_draw_column(self, tid: str):
+        for track, _y, _fill in PREVIEW_ROWS:
+            self._preview_draw_tile(track, tid)
+        x = PREVIEW_PAD_X + self._preview_pos[tid] * (PREVIEW_TILE + PREVIEW_GAP)
+        self._preview_labels[tid] = self.preview_canvas.create_text(
+            x + PREVIEW_TILE / 2, PREVIEW_Y_FREE + PREVIEW_TILE + 16, text=tid, fill=MUTED, font=FONT
+        )
+
+    def _preview_draw_tile(self, track: str, tid: str):
+        # Creates, updates or removes one tile so it matches the tier's current rewards.
+        c = self.preview_canvas
+        tiers = self._collection(track)
+        items = self._preview_tiles.get((track, tid))
+        sprite = None
+        if tid in tiers:
+            rewards = self._collection("rewards")
+            models = [Reward.view(rewards.get(rid)) for rid in Tier.view(tiers.get(tid)).reward_ids]
+            emoji = "".join([r.emoji for r in models])
+            y, fill = next((y, fill) for tr, y, fill in PREVIEW_ROWS if tr == track)
+            # a sprite tile is a single image item, a text tile is (rect, text); empty tiers always take the
+            # text path, since the emoji font need not have the dash
+            if emoji and self.sprites.available:
+                sprite = self.sprites.get(fill, emoji, any(r.glow for r in models))
+            emoji = emoji or "—"
+            if items and len(items) == (1 if sprite is not None else 2):
+                if sprite is not None:
+                    c.itemconfigure(items[0], image=sprite)
+                    self._preview_images[items[0]] = sprite
+                else:
+                    c.itemconfigure(items[1], text=emoji)
+                return
+        for item in items or ():
+            c.delete(item)
+            self._preview_hits.pop(item, None)
+            self._preview_images.pop(item, None)
+        self._preview_tiles.pop((track, tid), None)
+        if tid not in tiers:
+            return
+        x = PREVIEW_PAD_X + self._preview_pos[tid] * (PREVIEW_TILE + PREVIEW_GAP)
+        if sprite is not None:
+            image = c.create_image(x + PREVIEW_TILE / 2, y + PREVIEW_TILE / 2, image=sprite, tags=("tile",))
+            self._preview_tiles[(track, tid)] = (image,)
+            self._preview_hits[image] = (track, tid)
+            self._preview_images[image] = sprite
+            return
+        rect = c.create_rectangle(x, y, x + PREVIEW_TILE, y + PREVIEW_TILE, fill=fill, outline="", tags=("tile",))
+        text = c.create_text(x + PREVIEW_TILE / 2, y + PREVIEW_TILE / 2, text=emoji, font=("Segoe UI", 16), tags=("tile",))
+        self._preview_tiles[(track, tid)] = (rect, text)
+        self._preview_hits[rect] = self._preview_hits[text] = (track, tid)
+
+    def _on_preview_xscroll(self, first, last):
+        self.preview_scroll.set(first, last)
+        if self._preview_level > 0:
+            self._preview_draw_blocks()
+        else:
+            self._preview_cull()
+        self._minimap_view()
+
+    # -------------------------
+    # Preview zoom levels and minimap
+    # -------------------------
+    def _preview_leaf(self, track: str, tid: str):
+        tiers = self._collection(track)
+        if tid not in tiers:
+            return None
+        tier = Tier.view(tiers.get(tid))
+        rewards = self._collection("rewards")
+        types = {}
+        for rid in tier.reward_ids:
+            kind = Reward.view(rewards.get(rid)).kind
+            types[kind] = types.get(kind, 0) + 1
+        return TierSummary(1, len(tier.reward_ids), types, tier.points, tier.points)
+
+    def _preview_splice(self, ids, pos) -> bool:
+        # Added and removed tiers go in and out of the segments column by column; False when the columns
+        # changed some other way and only a rebuild fits.
+        old = self._preview_ids
+        old_pos = self._preview_pos
+        if [tid for tid in old if tid in pos] != [tid for tid in ids if tid in old_pos]:
+            return False
+        segments = self._preview_segments
+        for col in reversed([col for col, tid in enumerate(old) if tid not in pos]):
+            segments.remove(col)
+        for col, tid in enumerate(ids):
+            if tid not in old_pos:
+                segments.insert(col, {track: self._preview_leaf(track, tid) for track, _y, _f in PREVIEW_ROWS})
+        return True
+
+    def _preview_summary(self) -> TierSegments:
+        if self._preview_segments is None:
+            leaves = {track: [self._preview_leaf(track, tid) for tid in self._preview_ids] for track, _y, _f in PREVIEW_ROWS}
+            self._preview_segments = TierSegments(leaves)
+        return self._preview_segments
+
+    def _preview_draw_blocks(self, force=False):
+        # Zoomed out: each column is a block of tiers summarised from the segment levels; only the
+        # visible blocks are drawn, so this is bounded by the view width, not the tier count.
+        c = self.preview_canvas
+        segments = self._preview_summary()
+        if self._preview_level >= segments.depth:
+            # the season shrank below this zoom level
+            self._preview_level = segments.depth - 1
+            self._preview_zoom_label()
+        level = self._preview_level
+        count = segments.count(level)
+        self._preview_set_region(count)
+        cols = self._preview_visible_columns(count)
+        if not force and (level, cols) == self._preview_block_range:
+            return
+        self._preview_block_range = (level, cols)
+        c.delete("block")
+        self._preview_block_hits = {}
+        size = segments.factor ** level
+        for index in cols:
+            x = PREVIEW_PAD_X + index * (PREVIEW_TILE + PREVIEW_GAP)
+            for track, y, fill in PREVIEW_ROWS:
+                s = segments.block(track, level, index)
+                if s is None:
+                    continue
+                emoji = emoji_for(s.dominant(), "", "", False)
+                rect = c.create_rectangle(x, y, x + PREVIEW_TILE, y + PREVIEW_TILE, fill=fill, outline="", tags=("block",))
+                text = c.create_text(
+                    x + PREVIEW_TILE / 2, y + PREVIEW_TILE / 2, text=f"{emoji}\n×{s.rewards}", font=FONT, tags=("block",)
+                )
+                self._preview_block_hits[rect] = self._preview_block_hits[text] = (track, level, index)
+            ids = self._preview_ids[index * size:(index + 1) * size]
+            c.create_text(
+                x + PREVIEW_TILE / 2, PREVIEW_Y_FREE + PREVIEW_TILE + 16, text=f"{ids[0]}-{ids[-1]}" if ids else "",
+                fill=MUTED, font=FONT, tags=("block",)
+            )
+
+    def _preview_zoom(self, level: int):
+        depth = self._preview_summary().depth if self._preview_ids else 1
+        level = max(0, min(level, depth - 1))
+        if level == self._preview_level:
+            return
+        # keep the tier at the middle of the view in the middle
+        c = self.preview_canvas
+        step = PREVIEW_TILE + PREVIEW_GAP
+        half = max(1, c.winfo_width()) / 2
+        middle = (c.canvasx(half) - PREVIEW_PAD_X) / step * (PREVIEW_ZOOM_FACTOR ** self._preview_level)
+        self._preview_level = level
+        self._preview_block_range = None
+        self._preview_redraw(self._preview_ids)
+        x = PREVIEW_PAD_X + middle / (PREVIEW_ZOOM_FACTOR ** level) * step - half
+        c.xview_moveto(max(0.0, x / self._preview_region[2]))
+        self._preview_zoom_label()
+
+    def _preview_zoom_label(self):
+        size = PREVIEW_ZOOM_FACTOR ** self._preview_level
+        self.preview_zoom_var.set("1 tier per column" if size == 1 else f"{size} tiers per column")
+
+    def _on_preview_zoom_wheel(self, e):
+        self._preview_zoom(self._preview_level + (1 if e.delta < 0 else -1))
+        return "break"
+
+    def _preview_block_at(self):
+        current = self.preview_canvas.find_withtag("current")
+        return self._preview_block_hits.get(current[0]) if current else None
+
+    def _on_preview_block_enter(self, e):
+        hit = self._preview_block_at()
+        if hit is None:
+            return
+        track, level, index = hit
+        s = self._preview_summary().block(track, level, index)
+        if s is None:
+            return
+        size = PREVIEW_ZOOM_FACTOR ** level
+        ids = self._preview_ids[index * size:(index + 1) * size]
+        kinds = ", ".join(f"{kind or '?'} {n}" for kind, n in sorted(s.types.items(), key=lambda kv: -kv[1]))
+        tip = (
+            f"Tiers {ids[0]}-{ids[-1]}\n{track.title()}\n\n{s.tiers} tier(s), {s.rewards} reward(s)\n"
+            f"Types: {kinds or 'none'}\nPoints: {s.span()}"
+        )
+        self.tooltip.show(tip, e.x_root, e.y_root)
+
+    def _on_preview_block_click(self, _e):
+        # zoom one level in around the clicked block
+        hit = self._preview_block_at()
+        if hit is None:
+            return
+        self.tooltip.hide()
+        self._preview_zoom(hit[1] - 1)
+
+    def _draw_minimap(self):
+        # The whole season in at most MINIMAP_BARS bars per track, from the coarsest fitting segment level.
+        if not hasattr(self, "preview_minimap"):
+            return
+        m = self.preview_minimap
+        m.delete("all")
+        if not self._preview_ids:
+            return
+        segments = self._preview_summary()
+        level = 0
+        while segments.count(level) > MINIMAP_BARS:
+            level += 1
+        count = segments.count(level)
+        width = max(1, m.winfo_width())
+        height = max(1, m.winfo_height())
+        bar = width / count
+        half = height / 2
+        bars = []
+        for index in range(count):
+            for row, (track, _y, fill) in enumerate(PREVIEW_ROWS):
+                s = segments.block(track, level, index)
+                if s is not None:
+                    bars.append((index, row, fill, s))
+        peak = max((s.rewards for _i, _r, _f, s in bars), default=0) or 1
+        for index, row, fill, s in bars:
+            h = max(2, (half - 2) * s.rewards / peak)
+            base = half * (row + 1) - 1
+            m.create_rectangle(index * bar, base - h, (index + 1) * bar, base, fill=fill, outline="")
+        m.create_rectangle(0, 0, 0, height, outline=TEXT, width=1, tags=("viewport",))
+        self._minimap_view()
+
+    def _minimap_view(self):
+        if not hasattr(self, "preview_minimap"):
+            return
+        first, last = self.preview_canvas.xview()
+        width = max(1, self.preview_minimap.winfo_width())
+        height = max(1, self.preview_minimap.winfo_height())
+        self.preview_minimap.coords("viewport", first * width, 1, max(first * width + 2, last * width), height - 1)
+
+    def _on_minimap_click(self, e):
+        first, last = self.preview_canvas.xview()
+        width = max(1, self.preview_minimap.winfo_width())
+        self.preview_canvas.xview_moveto(max(0.0, e.x / width - (last - first) / 2))
+
+    def _preview_tile_at(self):
+        # -> (track, tier id) of the tile under the pointer
+        current = self.preview_canvas.find_withtag("current")
+        return self._preview_hits.get(current[0]) if current else None
+
+    def _on_preview_tile_enter(self, e):
+        hit = self._preview_tile_at()
+        if hit is None:
+            return
+        track, tid = hit
+        # tooltip text is only built for the tile being hovered
+        rewards = self._collection("rewards")
+        rids = Tier.view(self._collection(track).get(tid)).reward_ids
+        names = [Reward.view(rewards.get(rid)).label(rid) for rid in rids]
+        tip = f"Tier {tid}\n{track.title()}\n\n" + ("\n".join(names) if names else "No rewards")
+        self.tooltip.show(tip, e.x_root, e.y_root)
+
+    def _on_preview_tile_click(self, _e):
+        hit = self._preview_tile_at()
+        if hit is not None:
+            self._select_tier_from_preview(*hit)
 
     def _render_preview_quests(self):
+        self._invalidate("preview_quests")
+
+    def _draw_preview_quests(self):
         if not hasattr(self, "lb_preview_quests"):
             return
         self.lb_preview_quests.delete(0, "end")
         qd = self._quests_dict()
-        for qid in sorted(qd.keys(), key=numeric_sort_key):
+        for qid in self._sorted_ids("quests"):
             q = ensure_dict(qd.get(qid, {}))
             self.lb_preview_quests.insert("end", f"{qid}: {q.get('name', '')}")
 
@@ -2529,7 +5386,7 @@ class BattlePassStudio(tk.Tk):
         self.preview_canvas.configure(xscrollcommand=self.preview_hscroll.set)
 
     def _build_preview_quests(self):
-        if hasattr(self, "lb_preview_quests"):
+        if hasattr(self, "lb_preview_quests") or not hasattr(self, "preview_q"):
             return
         self.preview_q.grid_rowconfigure(0, weight=1)
         self.preview_q.grid_columnconfigure(0, weight=1)
@@ -2550,31 +5407,90 @@ class BattlePassStudio(tk.Tk):
         self._build_preview_quests()
 
     # -------------------------
-    # Override reload to build previews if needed
+    # Reload (builds previews if needed)
     # -------------------------
     def reload_all(self):
+        # Parses run on the IO pool; pressing Reload again supersedes (and cancels) an in-flight load.
+        # The UI stays usable meanwhile: a document edited after the load started keeps the edit.
+        if self._save_futures:
+            # the files may be half renamed over, and the finished save would mark the reloaded state clean
+            self.set_status("Save in progress; reload once it finishes.")
+            return
+        unsaved = [key for key, dirty in self.dirty.items() if dirty]
+        if unsaved and not messagebox.askyesno(
+            "Reload", f"Discard unsaved changes to {', '.join(unsaved)} and reload from disk?", parent=self
+        ):
+            self.set_status("Reload cancelled.")
+            return
+        self._load_generation += 1
+        generation = self._load_generation
+        for fut in self._load_futures:
+            fut.cancel()
+
+        paths = {
+            "free": self.path_free.get(),
+            "premium": self.path_premium.get(),
+            "rewards": self.path_rewards.get(),
+            "quests": self.path_quests.get(),
+            "week_pool": self.path_week_pool.get(),
+        }
+        self.doc_cache.snapshots = bool(self.snapshots_var.get())
+        futures = {
+            key: self._io_pool.submit(self.doc_cache.load, path, ENTITY_COLLECTIONS.get(key)) for key, path in paths.items()
+        }
+        self._load_futures = list(futures.values())
+
+        def progress(done, total):
+            if generation == self._load_generation:
+                self._show_progress(done, total)
+                self.set_status(f"Loading... {done}/{total}")
+
+        seq = self.journal.seq
+        self._when_done(self._load_futures, lambda: self._finish_reload(generation, paths, futures, seq), progress)
+
+    def _finish_reload(self, generation, paths, futures, seq=0):
+        if generation != self._load_generation:
+            return
+        self._load_futures = []
+        self._hide_progress()
         try:
-            self._ensure_preview_built()
-            self.state["free"] = safe_load_yaml(self.path_free.get())
-            self.state["premium"] = safe_load_yaml(self.path_premium.get())
-            self.state["rewards"] = safe_load_yaml(self.path_rewards.get())
+            results = {key: fut.result() for key, fut in futures.items()}
 
-            qp = self.path_quests.get()
-            self.state["quests_path"] = qp
-            self.state["quests"] = safe_load_yaml(qp)
+            self._ensure_preview_built()
+            # documents edited while the files were loading keep their edits (and stay dirty)
+            kept = [key for key in results if self.journal.touched(seq, key) != set()]
+            for key in kept:
+                del results[key]
+            if "quests" in results:
+                self.state["quests_path"] = paths["quests"]
+            if "week_pool" in results:
+                self.state["week_pool_path"] = paths["week_pool"]
 
-            wp = self.path_week_pool.get()
-            self.state["week_pool_path"] = wp
-            self.state["week_pool"] = safe_load_yaml(wp)
+            self._prepared.clear()
+            parsed = 0
+            interned = InternStats()
+            for key, (data, was_parsed, layout) in results.items():
+                self.state[key] = data
+                self._layouts[key] = layout
+                parsed += int(was_parsed)
+                if was_parsed:
+                    interned.add(self.doc_cache.intern_stats.get(os.path.abspath(paths[key]), InternStats()))
 
-            for key in self.dirty:
+            for key in results:
+                self._document_changed(key)
                 self.mark_dirty(key, False)
+            self._undo_reset()
 
             self._reward_refresh_list()
             self._tiers_refresh_list()
             self._quests_refresh_list()
             self._render_preview()
-            self.set_status("Loaded files successfully.")
+            status = f"Loaded files successfully ({parsed} parsed, {len(results) - parsed} reused)"
+            if interned.shared:
+                status += f"; interning: {interned}"
+            if kept:
+                status += f"; kept edits made during the load to {', '.join(kept)}"
+            self.set_status(status + ".")
         except Exception as e:
             self.set_status(f"Load error: {e}")
 
@@ -2606,6 +5522,7 @@ class BattlePassStudio(tk.Tk):
 
 
     def _select_iid(self, tv: ttk.Treeview, iid: str):
+        self._flush_views()
         try:
             tv.selection_set(str(iid))
             tv.focus(str(iid))
@@ -2626,15 +5543,10 @@ class BattlePassStudio(tk.Tk):
 
 
     def _reward_is_referenced(self, rid: str) -> bool:
-        rid = str(rid)
-        for tr in ("free", "premium"):
-            pd = ensure_dict(self.state.get(tr, {}))
-            tiers = ensure_dict(pd.get("tiers", {}))
-            for _tid, t in tiers.items():
-                rewards = [str(x) for x in ensure_list(ensure_dict(t).get("rewards", []))]
-                if rid in rewards:
-                    return True
-        return False
+        return self.reward_refs.is_referenced(rid)
+
+    def _reward_used_by(self, rid: str) -> list[tuple[str, str]]:
+        return sorted(self.reward_refs.users(rid), key=lambda ref: (ref[0], numeric_sort_key(ref[1])))
 
 
     def _reward_clear_editor(self):
@@ -2670,7 +5582,400 @@ class BattlePassStudio(tk.Tk):
             self._set_text(self.txt_item_lore, "")
 
 
+# =========================
+# BENCHMARKS
+# =========================
+BENCH_GROUPS = ["Combat", "Mining", "Farming", "Utility", "Exploration"]
+
+
+def synthetic_rewards(entries: int, rng=random) -> dict:
+    rewards = {}
+    for i in range(1, entries + 1):
+        reward = gen_random_reward(rng=rng)
+        reward["group"] = rng.choice(BENCH_GROUPS)
+        rewards[str(i)] = reward
+    return rewards
+
+
+def synthetic_season(entries: int, seed: int = 1234) -> dict:
+    rng = random.Random(seed)
+    rewards = synthetic_rewards(entries, rng)
+    reward_ids = list(rewards.keys())
+    tracks = {}
+    for track, limit in (("free", FREE_TIER_REWARD_LIMIT), ("premium", PREMIUM_TIER_REWARD_LIMIT)):
+        tiers = {}
+        for i in range(1, entries + 1):
+            tiers[str(i)] = {"required-points": i * 50, "rewards": rng.sample(reward_ids, min(limit, len(reward_ids)))}
+        tracks[track] = {"tiers": tiers}
+    quests = {str(i): gen_random_quest(rng) for i in range(1, entries + 1)}
+    return {
+        "free": tracks["free"],
+        "premium": tracks["premium"],
+        "rewards": rewards,
+        "quests": {"quests": quests},
+    }
+
+
+def _bench_time(fn, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench_yaml_backends(sizes=(1000, 10000, 100000)):
+    print(f"{'entries':>8} {'backend':>8} {'doc':>8} {'MB':>7} {'dump s':>8} {'load s':>8} {'dump MB/s':>10} {'load MB/s':>10}")
+    for size in sizes:
+        season = synthetic_season(size)
+        repeat = 1 if size >= 100000 else 3
+        for backend in YAML_BACKENDS:
+            for doc, data in season.items():
+                text = dump_yaml_text(data, backend)
+                mb = len(text.encode("utf-8")) / 1e6
+                t_dump = _bench_time(lambda: dump_yaml_text(data, backend), repeat)
+                t_load = _bench_time(lambda: load_yaml_text(text, backend), repeat)
+                print(
+                    f"{size:>8} {backend:>8} {doc:>8} {mb:>7.2f} {t_dump:>8.3f} {t_load:>8.3f}"
+                    f" {mb / t_dump:>10.2f} {mb / t_load:>10.2f}"
+                )
+            if backend != "python":
+                same = all(dump_yaml_text(d, backend) == dump_yaml_text(d, "python") for d in season.values())
+                print(f"{size:>8} {backend:>8} output identical to python backend: {same}")
+
+
+def bench_startup(sizes=(1000, 10000, 50000)):
+    # cold: YAML parse (what every start used to cost); first: parse + writing the snapshot; warm: snapshot read;
+    # hit: reload of an unchanged file from the in-process cache (the detached copy it hands out)
+    print(
+        f"{'entries':>8} {'doc':>8} {'MB':>7} {'cold s':>8} {'first s':>8} {'warm s':>8} {'speedup':>8} {'hit s':>8}"
+    )
+    for size in sizes:
+        season = synthetic_season(size)
+        repeat = 1 if size >= 50000 else 3
+        with tempfile.TemporaryDirectory() as directory:
+            for doc, data in season.items():
+                path = os.path.join(directory, f"{doc}.yml")
+                with open(path, "wb") as f:
+                    f.write(encode_document(dump_yaml_text(data)))
+                collection = ENTITY_COLLECTIONS.get(doc)
+                mb = os.path.getsize(path) / 1e6
+
+                def first_open():
+                    _remove_quietly(snapshot_path(path))
+                    DocumentCache(snapshots=True).load(path, collection)
+
+                t_cold = _bench_time(lambda: DocumentCache().load(path, collection), repeat)
+                t_first = _bench_time(first_open, repeat)
+                t_warm = _bench_time(lambda: DocumentCache(snapshots=True).load(path, collection), repeat)
+                cache = DocumentCache(hash_contents=False)
+                cache.load(path, collection)
+                t_hit = _bench_time(lambda: cache.load(path, collection), repeat)
+                print(
+                    f"{size:>8} {doc:>8} {mb:>7.2f} {t_cold:>8.3f} {t_first:>8.3f} {t_warm:>8.3f}"
+                    f" {t_cold / t_warm:>7.1f}x {t_hit:>8.4f}"
+                )
+                _remove_quietly(snapshot_path(path))
+
+
+def bench_copy(sizes=(1000, 10000)):
+    # per-entity duplicates (what Duplicate does) and whole-document snapshots (what Save does)
+    engines = {
+        "yaml": lambda obj: yaml.safe_load(yaml.safe_dump(obj)),
+        "deepcopy": copy.deepcopy,
+        "structural": structural_copy,
+        "cow": cow_copy,
+    }
+    print(f"{'entries':>8} {'doc':>8} {'engine':>10} {'entities s':>11} {'document s':>11}")
+    for size in sizes:
+        season = synthetic_season(size)
+        for doc, data in season.items():
+            coll = ensure_dict(data.get(ENTITY_COLLECTIONS[doc]) if ENTITY_COLLECTIONS[doc] else data)
+            entities = list(coll.values())
+            for name, engine in engines.items():
+                t_entities = _bench_time(lambda: [engine(v) for v in entities])
+                # a shallow document copy isn't a save snapshot, so cow has no document column
+                t_doc = f"{_bench_time(lambda: engine(data), 1):.4f}" if name != "cow" else "-"
+                print(f"{size:>8} {doc:>8} {name:>10} {t_entities:>11.4f} {t_doc:>11}")
+
+
+def bench_groups(sizes=(1000, 10000, 100000)):
+    # one filter switch: the combobox values plus the ids to list for the chosen group
+    print(f"{'entries':>8} {'scan us':>10} {'index us':>10} {'edit us':>9}")
+    for size in sizes:
+        rng = random.Random(size)
+        rewards = synthetic_rewards(size, rng)
+        ids = sorted(rewards, key=numeric_sort_key)
+
+        def scan():
+            groups = sorted({str(ensure_dict(r).get("group", "")).strip() for r in rewards.values()} - {""})
+            listed = [rid for rid in ids if str(ensure_dict(rewards[rid]).get("group", "")).strip() == groups[0]]
+            return groups, listed
+
+        index = GroupIndex()
+        index.rebuild(rewards)
+        groups = index.groups()
+
+        def switch():
+            for group in groups:
+                index.groups()
+                index.ordered(group)
+
+        def edit():
+            # regroup one reward and switch to its new group, the cost of an edit followed by a refresh
+            rid, group = rng.choice(ids), rng.choice(BENCH_GROUPS)
+            index.set(rid, group)
+            index.ordered(group)
+
+        t_scan = _bench_time(scan)
+        t_index = _bench_time(switch) / len(groups)
+        t_edit = _bench_time(lambda: [edit() for _ in range(100)]) / 100
+        print(f"{size:>8} {t_scan * 1e6:>10.1f} {t_index * 1e6:>10.2f} {t_edit * 1e6:>9.1f}")
+
+
+def bench_emoji(sizes=(1000, 10000)):
+    # item emoji per reward: scanning the substring rules vs. the per-material table
+    print(f"{'rewards':>8} {'rules ms':>9} {'table ms':>9}")
+    for size in sizes:
+        rewards = synthetic_rewards(size, random.Random(size))
+        mats = [str(ensure_dict(ensure_dict(r.get("items", {})).get("1", {})).get("material", "")).lower() for r in rewards.values()]
+        t_rules = _bench_time(lambda: [next((e for w, e in ITEM_EMOJI_RULES if any(x in m for x in w)), "🎁") for m in mats])
+        t_table = _bench_time(lambda: [MATERIAL_EMOJI.get(m) or material_emoji(m) for m in mats])
+        print(f"{size:>8} {t_rules * 1e3:>9.2f} {t_table * 1e3:>9.2f}")
+
+
+class _BenchRows:
+    # stands in for the Treeview in bench_refresh: keeps the rows it is given and counts the calls it gets
+    def __init__(self):
+        self.rows = []
+        self.calls = 0
+
+    def delete(self, *iids):
+        self.calls += 1
+        drop = set(iids)
+        self.rows = [r for r in self.rows if r[0] not in drop]
+
+    def insert(self, pos, iid, values):
+        self.calls += 1
+        self.rows.insert(pos, (iid, values))
+
+    def item(self, iid, values):
+        self.calls += 1
+        self.rows = [(i, values if i == iid else v) for i, v in self.rows]
+
+    def move(self, iid, pos):
+        self.calls += 1
+        row = next(r for r in self.rows if r[0] == iid)
+        self.rows.remove(row)
+        self.rows.insert(pos, row)
+
+
+def bench_refresh(sizes=(1000, 10000)):
+    # list refresh after applying one reward: clearing and re-inserting the whole sorted list (what the
+    # refresh_* methods did before virtualization), deleting and re-inserting the visible window, and applying
+    # diff_rows to it; "calls" are the row calls each one made on a counting stand-in for the Treeview
+    print(
+        f"{'rows':>8} {'window':>7} {'full ms':>9} {'calls':>7} {'rebuild ms':>11} {'calls':>7}"
+        f" {'diff ms':>9} {'calls':>7}"
+    )
+    for size in sizes:
+        rng = random.Random(size)
+        rewards = synthetic_rewards(size, rng)
+        ids = sorted(rewards, key=numeric_sort_key)
+
+        def row(rid):
+            r = rewards[rid]
+            return (rid, str(r.get("name", "")), str(r.get("type", "")), str(r.get("group", "")).strip())
+
+        window = 18 + VIRTUAL_OVERSCAN
+        target = ids[window // 2]
+        tree = _BenchRows()
+        for pos, rid in enumerate(ids[:window]):
+            tree.insert(pos, rid, row(rid))
+        full_tree = _BenchRows()
+
+        def apply():
+            rewards[target] = {**rewards[target], "name": f"Edited {rng.random():.6f}"}
+
+        def full():
+            apply()
+            full_tree.delete(*[iid for iid, _values in full_tree.rows])
+            for pos, rid in enumerate(sorted(rewards, key=numeric_sort_key)):
+                full_tree.insert(pos, rid, row(rid))
+
+        def rebuild():
+            apply()
+            tree.delete(*[iid for iid, _values in tree.rows])
+            for pos, rid in enumerate(ids[:window]):
+                tree.insert(pos, rid, row(rid))
+
+        def diff():
+            apply()
+            cached = dict(tree.rows)
+            wanted = [(rid, row(rid) if rid == target else cached[rid]) for rid in ids[:window]]
+            for op in diff_rows(tree.rows, wanted):
+                getattr(tree, op[0])(*op[1:])
+
+        full()
+        counts = []
+        for refresh, rows in ((full, full_tree), (rebuild, tree), (diff, tree)):
+            rows.calls = 0
+            refresh()
+            counts.append(rows.calls)
+        t_full = _bench_time(full)
+        t_rebuild = _bench_time(rebuild)
+        t_diff = _bench_time(diff)
+        print(
+            f"{size:>8} {window:>7} {t_full * 1e3:>9.3f} {counts[0]:>7} {t_rebuild * 1e3:>11.3f} {counts[1]:>7}"
+            f" {t_diff * 1e3:>9.3f} {counts[2]:>7}"
+        )
+
+
+def bench_sprites(sizes=(1000,)):
+    # Pillow render cost per distinct tile, then one redraw of the visible preview window:
+    # rectangle + emoji text per tile vs. one cached image per tile (the canvas part needs a display)
+    sprites = TileSprites(None)
+    if not sprites.available:
+        print("Pillow or a colour emoji font is missing; the preview keeps the text path")
+    visible = 1400 // (PREVIEW_TILE + PREVIEW_GAP) + 1
+    windows = {}
+    for size in sizes:
+        season = synthetic_season(size)
+        rewards = {rid: Reward(r) for rid, r in season["rewards"].items()}
+        tiles = []
+        for track, y, fill in PREVIEW_ROWS:
+            for col, tier in enumerate(season[track]["tiers"].values()):
+                models = [rewards[str(rid)] for rid in tier["rewards"]]
+                emoji = "".join([r.emoji for r in models])
+                tiles.append((col, y, fill, emoji, any(r.glow for r in models)))
+        windows[size] = [t for t in tiles if t[0] < visible]
+        if sprites.available:
+            keys = list({(fill, emoji, glow) for _col, _y, fill, emoji, glow in tiles if emoji})[:SPRITE_CACHE_LIMIT]
+            t_draw = _bench_time(lambda: [sprites._draw(*key) for key in keys], 1)
+            print(f"{size:>8} tiers: {len(keys)} distinct tiles, {t_draw * 1e3 / len(keys):.3f} ms to render each")
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"canvas timings need a display: {e}")
+        return
+    root.geometry("1400x320")
+    canvas = tk.Canvas(root, width=1400, height=300)
+    canvas.pack()
+    sprites = TileSprites(root)
+    print(f"{'tiers':>8} {'tiles':>6} {'text ms':>9} {'sprite ms':>10} {'cold ms':>9} {'images':>7}")
+    for size, window in windows.items():
+        shown = []
+
+        def text():
+            canvas.delete("all")
+            for col, y, fill, emoji, _glow in window:
+                x = PREVIEW_PAD_X + col * (PREVIEW_TILE + PREVIEW_GAP)
+                canvas.create_rectangle(x, y, x + PREVIEW_TILE, y + PREVIEW_TILE, fill=fill, outline="")
+                canvas.create_text(
+                    x + PREVIEW_TILE / 2, y + PREVIEW_TILE / 2, text=emoji or "—", font=("Segoe UI", 16)
+                )
+            root.update()
+
+        def sprite():
+            canvas.delete("all")
+            shown.clear()
+            for col, y, fill, emoji, glow in window:
+                x = PREVIEW_PAD_X + col * (PREVIEW_TILE + PREVIEW_GAP)
+                if not emoji:
+                    canvas.create_rectangle(x, y, x + PREVIEW_TILE, y + PREVIEW_TILE, fill=fill, outline="")
+                    canvas.create_text(x + PREVIEW_TILE / 2, y + PREVIEW_TILE / 2, text="—", font=("Segoe UI", 16))
+                    continue
+                shown.append(sprites.get(fill, emoji, glow))
+                canvas.create_image(x + PREVIEW_TILE / 2, y + PREVIEW_TILE / 2, image=shown[-1])
+            root.update()
+
+        t_text = _bench_time(text)
+        if sprites.available:
+            t_cold = _bench_time(sprite, repeat=1)
+            t_sprite = _bench_time(sprite)
+            print(f"{size:>8} {len(window):>6} {t_text * 1e3:>9.1f} {t_sprite * 1e3:>10.1f} {t_cold * 1e3:>9.1f} {len(sprites):>7}")
+        else:
+            print(f"{size:>8} {len(window):>6} {t_text * 1e3:>9.1f} {'-':>10} {'-':>9} {'-':>7}")
+    root.destroy()
+
+
+def bench_intern(sizes=(1000, 10000)):
+    # memory of freshly parsed documents (every string its own object) before and after intern_tree
+    import tracemalloc
+
+    print(f"{'entries':>8} {'doc':>8} {'parsed MB':>10} {'interned MB':>12} {'intern s':>9}  stats")
+    for size in sizes:
+        season = synthetic_season(size)
+        for doc, data in season.items():
+            text = dump_yaml_text(data)
+            tracemalloc.start()
+            parsed = load_yaml_text(text)
+            before = tracemalloc.get_traced_memory()[0]
+            stats = InternStats()
+            parsed = intern_tree(parsed, stats)
+            after = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            fresh = load_yaml_text(text)
+            elapsed = _bench_time(lambda: intern_tree(fresh), 1)
+            print(f"{size:>8} {doc:>8} {before / 1e6:>10.2f} {after / 1e6:>12.2f} {elapsed:>9.3f}  {stats}")
+
+
+def bench_model(sizes=(1000, 10000)):
+    # bytes per entity of a loaded document (nested values included): plain dicts vs. after adopt_entities
+    import tracemalloc
+
+    print(f"{'entries':>8} {'doc':>8} {'dict B':>8} {'entity B':>9} {'saved':>6}")
+    for size in sizes:
+        season = synthetic_season(size)
+        for doc in ("rewards", "free"):
+            text = dump_yaml_text(season[doc])
+            collection = ENTITY_COLLECTIONS[doc]
+            tracemalloc.start()
+            parsed = intern_tree(load_yaml_text(text))
+            as_dicts = tracemalloc.get_traced_memory()[0]
+            adopt_entities(parsed, collection)
+            as_entities = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            n = len(parsed if collection == "" else parsed[collection])
+            print(
+                f"{size:>8} {doc:>8} {as_dicts / n:>8.0f} {as_entities / n:>9.0f}"
+                f" {1 - as_entities / as_dicts:>6.0%}"
+            )
+
+
+BENCHMARKS = {
+    "yaml": bench_yaml_backends,
+    "startup": bench_startup,
+    "copy": bench_copy,
+    "groups": bench_groups,
+    "intern": bench_intern,
+    "model": bench_model,
+    "refresh": bench_refresh,
+    "sprites": bench_sprites,
+    "emoji": bench_emoji,
+}
+
+
+def run_benchmarks(args):
+    names = [a for a in args if not a.isdigit()] or list(BENCHMARKS)
+    sizes = tuple(int(a) for a in args if a.isdigit())
+    for name in names:
+        bench = BENCHMARKS.get(name)
+        if not bench:
+            print(f"Unknown benchmark: {name} (available: {', '.join(BENCHMARKS)})")
+            continue
+        print(f"== {name} ==")
+        if sizes:
+            bench(sizes)
+        else:
+            bench()
+
 
 if __name__ == "__main__":
-    app = BattlePassStudio()
-    app.mainloop()
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        run_benchmarks(sys.argv[2:])
+    else:
+        app = BattlePassStudio()
+        app.mainloop()